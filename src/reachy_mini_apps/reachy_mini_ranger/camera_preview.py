@@ -12,6 +12,18 @@ from reachy_mini import ReachyMini
 from reachy_mini_ranger.brain.nodes.perception.vision_node import process_camera_frame
 
 
+# Detect on every DETECT_STRIDE-th frame only; frames in between are drawn
+# with the last detections (overlay lag is invisible at camera rate)
+DETECT_STRIDE = 3
+
+# Drawing constants (BGR)
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+GREEN = (0, 255, 0)
+YELLOW = (0, 255, 255)
+MAGENTA = (255, 0, 255)
+WHITE = (255, 255, 255)
+
+
 def main():
     """Run camera preview with face detection."""
     print("Connecting to ReachyMini...")
@@ -24,6 +36,9 @@ def main():
             return
         
         frame_count = 0
+        last_faces, last_humans = [], []
+        counts_text = "Faces: 0 | Humans: 0"
+        frame_height, info_org = None, None
         
         while True:
             # Get frame
@@ -32,44 +47,58 @@ def main():
                 print("WARNING: Failed to get frame")
                 continue
             
+            # Run face detection on every DETECT_STRIDE-th frame, as it arrives
+            if frame_count % DETECT_STRIDE == 0:
+                last_faces, last_humans, _ = process_camera_frame(
+                    frame, frame.shape[1], frame.shape[0]
+                )
+                # Counts only change when detection runs
+                counts_text = f"Faces: {len(last_faces)} | Humans: {len(last_humans)}"
+            faces, humans = last_faces, last_humans
             frame_count += 1
-            h, w = frame.shape[:2]
             
-            # Run face detection every frame
-            faces, humans, primary_id = process_camera_frame(frame, w, h)
+            # Info text position only changes with the frame size
+            if frame.shape[0] != frame_height:
+                frame_height = frame.shape[0]
+                info_org = (10, frame_height - 10)
             
-            # Draw detections
-            for face in faces:
-                # Draw bounding box
-                x1, y1 = int(face.x), int(face.y)
-                x2, y2 = int(face.x + face.width), int(face.y + face.height)
-                color = (0, 255, 0)  # Green
-                cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+            # Draw detections (all boxes in one OpenCV call)
+            if faces:
+                # Box corners for all faces at once: (N, 4, 2) int32 polygons
+                xywh = np.array([(f.x, f.y, f.width, f.height) for f in faces], dtype=np.float32)
+                x1y1 = xywh[:, 0:2].astype(np.int32)
+                x2y2 = (xywh[:, 0:2] + xywh[:, 2:4]).astype(np.int32)
+                corners = np.empty((len(faces), 4, 2), dtype=np.int32)
+                corners[:, 0] = x1y1
+                corners[:, 1, 0], corners[:, 1, 1] = x2y2[:, 0], x1y1[:, 1]
+                corners[:, 2] = x2y2
+                corners[:, 3, 0], corners[:, 3, 1] = x1y1[:, 0], x2y2[:, 1]
+                cv2.polylines(frame, corners, True, GREEN, 2)
                 
                 # Draw confidence
-                conf_text = f"{face.confidence:.2f}"
-                cv2.putText(frame, conf_text, (x1, y1 - 10),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+                for face, (x1, y1) in zip(faces, x1y1.tolist()):
+                    cv2.putText(frame, f"{face.confidence:.2f}", (x1, y1 - 10),
+                                FONT, 0.5, GREEN, 2)
             
             # Draw human tracking info
             for idx, human in enumerate(humans):
                 # Draw position info
                 if human.is_primary:
                     pos_text = f"PRIMARY (ID:{human.persistent_id})"
-                    color = (0, 255, 255)  # Yellow for primary
+                    color = YELLOW
                 else:
                     pos_text = f"Human {human.persistent_id}"
-                    color = (255, 0, 255)  # Magenta for others
+                    color = MAGENTA
                 
                 # Draw 3D position
                 pos_3d = f"({human.position.x:.1f}, {human.position.y:.1f}, {human.position.z:.1f})m"
                 cv2.putText(frame, f"{pos_text}: {pos_3d}", (10, 30 + idx * 25),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+                           FONT, 0.5, color, 2)
             
             # Draw FPS and info
-            info_text = f"Frame: {frame_count} | Faces: {len(faces)} | Humans: {len(humans)}"
-            cv2.putText(frame, info_text, (10, h - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            info_text = f"Frame: {frame_count} | {counts_text}"
+            cv2.putText(frame, info_text, info_org,
+                       FONT, 0.6, WHITE, 2)
             
             # Display
             cv2.imshow('Robot Camera - Press Q to quit', frame)
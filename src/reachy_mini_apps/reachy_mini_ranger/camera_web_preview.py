@@ -3,8 +3,17 @@
 
 Serves camera feed with YOLO detections over HTTP.
 View at http://localhost:8080
+
+All viewers share one capture/detect/encode producer, which stops capturing
+while nobody is connected.
+
+JPEG encoding uses libjpeg-turbo (pip install PyTurboJPEG) when available,
+falling back to cv2.imencode otherwise.
 """
 
+import queue
+import threading
+
 import cv2
 import numpy as np
 from flask import Flask, Response
@@ -12,64 +21,201 @@ from reachy_mini import ReachyMini
 
 from reachy_mini_ranger.brain.nodes.perception.vision_node import process_camera_frame
 
+try:
+    from turbojpeg import TJSAMP_420, TurboJPEG
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError):
+    # PyTurboJPEG not installed or libjpeg-turbo shared library not found
+    _turbo_jpeg = None
+
 
 app = Flask(__name__)
 robot = None
 
+# Detect on every DETECT_STRIDE-th frame only; frames in between are drawn
+# with the last detections (overlay lag is invisible at camera rate)
+DETECT_STRIDE = 3
 
-def generate_frames():
-    """Generate camera frames with face detection overlays."""
-    global robot
+# Drawing constants (BGR)
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+GREEN = (0, 255, 0)
+YELLOW = (0, 255, 255)
+MAGENTA = (255, 0, 255)
+WHITE = (255, 255, 255)
+
+# libjpeg-turbo quality; the cv2.imencode fallback keeps OpenCV's default (95)
+JPEG_QUALITY = 75
+
+# multipart/x-mixed-replace framing around each JPEG payload
+MJPEG_PART_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+MJPEG_PART_TRAILER = b'\r\n'
+
+# Frames/chunks waiting per queue (oldest dropped when full)
+FRAME_QUEUE_SIZE = 2
+
+# One shared producer captures, detects and encodes each frame once and fans
+# the JPEG out to every connected viewer; it idles with no viewers
+SUBSCRIBERS: set[queue.Queue] = set()
+_subscribers_lock = threading.Lock()
+_has_subscribers = threading.Event()
+_producer_lock = threading.Lock()
+_producer_started = False
+
+
+def encode_jpeg(frame: np.ndarray) -> bytes:
+    """Encode a BGR frame as JPEG, preferring the SIMD libjpeg-turbo path."""
+    if _turbo_jpeg is not None:
+        return _turbo_jpeg.encode(frame, quality=JPEG_QUALITY, jpeg_subsample=TJSAMP_420)
+    ret, buffer = cv2.imencode('.jpg', frame)
+    return buffer.tobytes()
+
+
+def put_latest(frames: queue.Queue, item) -> None:
+    """Put item on a bounded queue, dropping the oldest entry if it is full."""
+    try:
+        frames.put_nowait(item)
+    except queue.Full:
+        try:
+            frames.get_nowait()
+        except queue.Empty:
+            pass
+        frames.put_nowait(item)
+
+
+def subscribe() -> queue.Queue:
+    """Register a viewer and return the queue its JPEG frames arrive on."""
+    chunks = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+    with _subscribers_lock:
+        SUBSCRIBERS.add(chunks)
+        _has_subscribers.set()
+    start_producer()
+    return chunks
+
+
+def unsubscribe(chunks: queue.Queue) -> None:
+    """Remove a viewer; the producer idles once the last one has left."""
+    with _subscribers_lock:
+        SUBSCRIBERS.discard(chunks)
+        if not SUBSCRIBERS:
+            _has_subscribers.clear()
+
+
+def start_producer() -> None:
+    """Start the shared capture/detect and draw/encode threads once."""
+    global _producer_started
+    with _producer_lock:
+        if _producer_started:
+            return
+        frames = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+        threading.Thread(target=detect_frames, args=(frames,), daemon=True).start()
+        threading.Thread(target=broadcast_frames, args=(frames,), daemon=True).start()
+        _producer_started = True
+
+
+def detect_frames(frames: queue.Queue) -> None:
+    """Capture and run face detection, pushing (frame, faces, humans) to frames.
+    
+    Runs on a background thread so detection of the next frame overlaps with
+    drawing and JPEG encoding of the previous one in broadcast_frames().
+    Blocks without capturing while no viewer is connected.
+    """
+    frame_count = 0
+    last_faces, last_humans = [], []
     
     while True:
+        if not _has_subscribers.is_set():
+            # Nobody watching: sleep until a viewer connects
+            _has_subscribers.wait()
+        
         # Get frame
         frame = robot.media.get_frame()
         if frame is None:
             continue
         
-        h, w = frame.shape[:2]
-        
-        # Run face detection
-        faces, humans, primary_id = process_camera_frame(frame, w, h)
+        # Run face detection on every DETECT_STRIDE-th frame, as it arrives
+        if frame_count % DETECT_STRIDE == 0:
+            last_faces, last_humans, _ = process_camera_frame(
+                frame, frame.shape[1], frame.shape[0]
+            )
+        frame_count += 1
+        put_latest(frames, (frame, last_faces, last_humans))
+
+
+def draw_detections(frame: np.ndarray, faces, humans) -> None:
+    """Draw face boxes, human tracking info and counts onto frame in place."""
+    h, w = frame.shape[:2]
+    
+    # Draw detections (all boxes in one OpenCV call)
+    if faces:
+        # Box corners for all faces at once: (N, 4, 2) int32 polygons
+        xywh = np.array([(f.x, f.y, f.width, f.height) for f in faces], dtype=np.float32)
+        x1y1 = xywh[:, 0:2].astype(np.int32)
+        x2y2 = (xywh[:, 0:2] + xywh[:, 2:4]).astype(np.int32)
+        corners = np.empty((len(faces), 4, 2), dtype=np.int32)
+        corners[:, 0] = x1y1
+        corners[:, 1, 0], corners[:, 1, 1] = x2y2[:, 0], x1y1[:, 1]
+        corners[:, 2] = x2y2
+        corners[:, 3, 0], corners[:, 3, 1] = x1y1[:, 0], x2y2[:, 1]
+        cv2.polylines(frame, corners, True, GREEN, 2)
         
-        # Draw detections
-        for face in faces:
-            # Draw bounding box
-            x1, y1 = int(face.x), int(face.y)
-            x2, y2 = int(face.x + face.width), int(face.y + face.height)
-            color = (0, 255, 0)  # Green
-            cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
-            
-            # Draw confidence
-            conf_text = f"{face.confidence:.2f}"
-            cv2.putText(frame, conf_text, (x1, y1 - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+        # Draw confidence
+        for face, (x1, y1) in zip(faces, x1y1.tolist()):
+            cv2.putText(frame, f"{face.confidence:.2f}", (x1, y1 - 10),
+                        FONT, 0.5, GREEN, 2)
+    
+    # Draw human tracking info
+    for idx, human in enumerate(humans):
+        if human.is_primary:
+            pos_text = f"PRIMARY (ID:{human.persistent_id})"
+            color = YELLOW
+        else:
+            pos_text = f"Human {human.persistent_id}"
+            color = MAGENTA
         
-        # Draw human tracking info
-        for idx, human in enumerate(humans):
-            if human.is_primary:
-                pos_text = f"PRIMARY (ID:{human.persistent_id})"
-                color = (0, 255, 255)  # Yellow
-            else:
-                pos_text = f"Human {human.persistent_id}"
-                color = (255, 0, 255)  # Magenta
-            
-            # Draw 3D position
-            pos_3d = f"({human.position.x:.1f}, {human.position.y:.1f}, {human.position.z:.1f})m"
-            cv2.putText(frame, f"{pos_text}: {pos_3d}", (10, 30 + idx * 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+        # Draw 3D position
+        pos_3d = f"({human.position.x:.1f}, {human.position.y:.1f}, {human.position.z:.1f})m"
+        cv2.putText(frame, f"{pos_text}: {pos_3d}", (10, 30 + idx * 25),
+                   FONT, 0.5, color, 2)
+    
+    # Draw FPS and info
+    info_text = f"Faces: {len(faces)} | Humans: {len(humans)}"
+    cv2.putText(frame, info_text, (10, h - 10),
+               FONT, 0.6, WHITE, 2)
+
+
+def broadcast_frames(frames: queue.Queue) -> None:
+    """Draw and encode each detected frame once and fan the JPEG out to all viewers."""
+    while True:
+        frame, faces, humans = frames.get()
+        if not _has_subscribers.is_set():
+            # Last viewer left while this frame was queued: skip the encode
+            continue
         
-        # Draw FPS and info
-        info_text = f"Faces: {len(faces)} | Humans: {len(humans)}"
-        cv2.putText(frame, info_text, (10, h - 10),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        draw_detections(frame, faces, humans)
         
         # Encode as JPEG
-        ret, buffer = cv2.imencode('.jpg', frame)
-        frame_bytes = buffer.tobytes()
+        frame_bytes = encode_jpeg(frame)
         
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+        with _subscribers_lock:
+            subscribers = list(SUBSCRIBERS)
+        for chunks in subscribers:
+            put_latest(chunks, frame_bytes)
+
+
+def generate_frames():
+    """Generate camera frames with face detection overlays for one viewer."""
+    chunks = subscribe()
+    try:
+        while True:
+            # Header, payload and trailer are written separately so the JPEG
+            # payload is never copied into a concatenated part
+            frame_bytes = chunks.get()
+            yield MJPEG_PART_HEADER
+            yield frame_bytes
+            yield MJPEG_PART_TRAILER
+    finally:
+        # Client disconnected: producer stops once no viewers remain
+        unsubscribe(chunks)
 
 
 @app.route('/video_feed')
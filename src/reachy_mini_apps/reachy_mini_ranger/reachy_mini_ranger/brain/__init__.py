@@ -11,3 +11,5 @@ All nodes operate on shared BrainState (Pydantic model) for type-safe data flow.
 """
 
 __version__ = "0.1.0"
+
+__all__ = ["__version__"]
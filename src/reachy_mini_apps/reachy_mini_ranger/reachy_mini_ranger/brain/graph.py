@@ -17,40 +17,67 @@ Usage:
     >>> result = graph.invoke(initial_state)
 """
 
-import functools
 import math
 import time
+from datetime import datetime
+from typing import Optional
+
 from langgraph.graph import StateGraph, START, END
 
-from reachy_mini_ranger.brain.models.state import BrainState, update_timestamp, add_log, HeadCommand
-from reachy_mini_ranger.brain.nodes.perception.vision_node import vision_node
-from reachy_mini_ranger.brain.utils.kinematics import calculate_look_at_with_safety
+from reachy_mini_ranger.brain.models.state import BrainState, update_timestamp, add_log, add_logs, HeadCommand
+from reachy_mini_ranger.brain.utils.kinematics import (
+    CLAMP_PITCH_HIGH,
+    CLAMP_PITCH_LOW,
+    CLAMP_ROLL_HIGH,
+    CLAMP_ROLL_LOW,
+    CLAMP_YAW_HIGH,
+    CLAMP_YAW_LOW,
+    calculate_look_at_with_safety,
+    clamp_head,
+)
+
+
+# (violation bit, axis, bound) for building execution_node's safety log
+_CLAMP_MESSAGES = (
+    (CLAMP_YAW_LOW, "yaw", "< -180°"),
+    (CLAMP_YAW_HIGH, "yaw", "> 180°"),
+    (CLAMP_PITCH_LOW, "pitch", "< -40°"),
+    (CLAMP_PITCH_HIGH, "pitch", "> 40°"),
+    (CLAMP_ROLL_LOW, "roll", "< -40°"),
+    (CLAMP_ROLL_HIGH, "roll", "> 40°"),
+)
 
 
 # ============================================================================
 # Perception Node Functions
 # ============================================================================
 
-def perception_node(state: BrainState, reachy_mini=None) -> BrainState:
+def perception_node(state: BrainState, reachy_mini=None, frame_source=None) -> BrainState:
     """Process sensory inputs (vision, audio).
     
     Currently implements:
     - Face detection via vision_node (YOLO-based)
     
     TODO:
-    - Audio wake word detection
+    - Audio wake word detection, as a parallel branch next to vision (Send
+      fan-out plus a reducer on sensors that merges the vision and audio
+      writes) so camera and microphone I/O overlap
     - Multi-modal sensor fusion
     
     Args:
         state: Current BrainState
         reachy_mini: ReachyMini instance (optional, for camera/audio access)
+        frame_source: Callable returning the latest shared camera frame (optional)
         
     Returns:
         Updated BrainState including face detections
     """
+    # Imported on first call so building the graph doesn't load torch/YOLO
+    from reachy_mini_ranger.brain.nodes.perception.vision_node import vision_node
+    
     # Run vision processing (vision_node handles logging and timestamp)
     # Pass reachy_mini for camera access (None in tests)
-    return vision_node(state, reachy_mini=reachy_mini)
+    return vision_node(state, reachy_mini=reachy_mini, frame_source=frame_source)
 
 
 def cognition_node(state: BrainState) -> BrainState:
@@ -67,22 +94,18 @@ def cognition_node(state: BrainState) -> BrainState:
     Returns:
         Updated BrainState with commanded head pose (base pose, before face tracking offsets)
     """
-    updated = state.model_copy(deep=True)
-    
     # Check if we have detected humans (face tracking handled by camera worker)
-    primary_human = next((h for h in updated.world_model.humans if h.is_primary), None)
-    
-    if primary_human:
+    if state.world_model.primary_human_id is not None:
         # Human detected - camera worker handles face tracking
         # Brain provides neutral "looking forward" base pose
         # Face tracking offsets will be applied in main loop
-        updated.actuator_commands.head = HeadCommand(
+        head = HeadCommand(
             yaw=0.0,
             pitch=0.0,
             roll=0.0,
             duration=0.0,
         )
-        updated = add_log(updated, "Cognition: Human detected, neutral base pose (face tracking active)")
+        message = "Cognition: Human detected, neutral base pose (face tracking active)"
     else:
         # No human detected - idle scanning behavior
         # Slow sinusoidal yaw sweep creates "curious" scanning motion
@@ -95,16 +118,21 @@ def cognition_node(state: BrainState) -> BrainState:
         pitch = 0.0  # Level head while scanning
         roll = 0.0
         
-        updated.actuator_commands.head = HeadCommand(
+        head = HeadCommand(
             yaw=yaw,
             pitch=pitch,
             roll=roll,
             duration=0.0,
         )
-        
-        updated = add_log(updated, f"Cognition: Idle scanning (yaw={yaw:.1f}°)")
+        message = f"Cognition: Idle scanning (yaw={yaw:.1f}°)"
     
-    updated = update_timestamp(updated)
+    # Shallow copy: only actuator_commands is replaced, the rest is shared
+    updated = state.model_copy(update={
+        "actuator_commands": state.actuator_commands.model_copy(update={"head": head}),
+    })
+    now = datetime.now()
+    updated = add_log(updated, message, now)
+    updated = update_timestamp(updated, now)
     
     # TODO: Update emotion, goals, current_plan
     
@@ -127,9 +155,9 @@ def skill_node(state: BrainState) -> BrainState:
     Returns:
         Updated BrainState
     """
-    updated = state.model_copy(deep=True)
-    updated = add_log(updated, "Skill node executed")
-    updated = update_timestamp(updated)
+    now = datetime.now()
+    updated = add_log(state, "Skills: ok", now)
+    updated = update_timestamp(updated, now)
     
     # Placeholder: In real implementation, would update:
     # - state.actuator_commands.head
@@ -148,7 +176,8 @@ def execution_node(state: BrainState) -> BrainState:
     - Head roll: ±40° (prevent cable strain)
     - Body-to-head yaw difference: ±65° (prevent body twist)
     
-    Violations are logged and clamped to safe limits.
+    Violations are logged and clamped to safe limits. Head angles are only
+    logged on violations or when metadata.verbose_logging is set.
     
     Note: This node prepares safe commands for execution. The main app
     loop actually executes commands via ReachyMini SDK.
@@ -159,44 +188,39 @@ def execution_node(state: BrainState) -> BrainState:
     Returns:
         Updated BrainState with validated actuator_commands
     """
-    updated = state.model_copy(deep=True)
-    
-    # Safety validation for head commands
-    head_cmd = updated.actuator_commands.head
+    # Safety validation for head commands (JIT-compiled clamp, see clamp_head)
+    head_cmd = state.actuator_commands.head
+    yaw, pitch, roll, violation_mask = clamp_head(head_cmd.yaw, head_cmd.pitch, head_cmd.roll)
     violations = []
     
-    # Clamp yaw to ±180°
-    if head_cmd.yaw < -180.0:
-        violations.append(f"yaw {head_cmd.yaw:.1f}° < -180° (clamped)")
-        head_cmd.yaw = -180.0
-    elif head_cmd.yaw > 180.0:
-        violations.append(f"yaw {head_cmd.yaw:.1f}° > 180° (clamped)")
-        head_cmd.yaw = 180.0
-    
-    # Clamp pitch to ±40°
-    if head_cmd.pitch < -40.0:
-        violations.append(f"pitch {head_cmd.pitch:.1f}° < -40° (clamped)")
-        head_cmd.pitch = -40.0
-    elif head_cmd.pitch > 40.0:
-        violations.append(f"pitch {head_cmd.pitch:.1f}° > 40° (clamped)")
-        head_cmd.pitch = 40.0
-    
-    # Clamp roll to ±40°
-    if head_cmd.roll < -40.0:
-        violations.append(f"roll {head_cmd.roll:.1f}° < -40° (clamped)")
-        head_cmd.roll = -40.0
-    elif head_cmd.roll > 40.0:
-        violations.append(f"roll {head_cmd.roll:.1f}° > 40° (clamped)")
-        head_cmd.roll = 40.0
-    
-    # Log safety violations
+    if violation_mask:
+        # Only build messages when a limit was actually hit
+        violations = [
+            f"{axis} {getattr(head_cmd, axis):.1f}° {bound} (clamped)"
+            for bit, axis, bound in _CLAMP_MESSAGES
+            if violation_mask & bit
+        ]
+        head_cmd = head_cmd.model_copy(update={"yaw": yaw, "pitch": pitch, "roll": roll})
+    
+    updated = state.model_copy(update={
+        "actuator_commands": state.actuator_commands.model_copy(update={"head": head_cmd}),
+    })
+    
+    # One clock read shared by this node's log entries and timestamp
+    now = datetime.now()
+    
+    # Log safety violations and execution with a single state copy
+    # (head angles only when something interesting happened)
+    messages = []
     if violations:
-        updated = add_log(updated, f"Safety violations: {', '.join(violations)}")
-    
-    # Log execution
-    updated = add_log(updated, 
-        f"Execution: head=({head_cmd.yaw:.1f}°, {head_cmd.pitch:.1f}°, {head_cmd.roll:.1f}°)")
-    updated = update_timestamp(updated)
+        messages.append(f"Safety violations: {', '.join(violations)}")
+    if violations or state.metadata.verbose_logging:
+        messages.append(
+            f"Execution: head=({head_cmd.yaw:.1f}°, {head_cmd.pitch:.1f}°, {head_cmd.roll:.1f}°)")
+    else:
+        messages.append("Execution: ok")
+    updated = add_logs(updated, messages, now)
+    updated = update_timestamp(updated, now)
     
     return updated
 
@@ -205,11 +229,25 @@ def execution_node(state: BrainState) -> BrainState:
 # Graph Construction
 # ============================================================================
 
-def create_graph(reachy_mini=None) -> StateGraph:
+def _bind_perception(reachy_mini, frame_source):
+    """Return a perception node closure bound to the given hardware.
+    
+    A plain closure avoids functools.partial's keyword merging on every
+    invoke. It is created once per compile_graph() call, not per cycle.
+    """
+    def perception_bound(state: BrainState) -> BrainState:
+        return perception_node(state, reachy_mini=reachy_mini, frame_source=frame_source)
+    
+    return perception_bound
+
+
+def create_graph(reachy_mini=None, frame_source=None) -> StateGraph:
     """Create the LangGraph StateGraph with all nodes and edges.
     
     Args:
         reachy_mini: Optional ReachyMini instance for hardware access (camera, audio)
+        frame_source: Optional callable returning the latest shared camera frame
+            (e.g. CameraWorker.get_latest_frame); replaces direct SDK capture
     
     Returns:
         StateGraph: Configured graph ready for compilation
@@ -222,9 +260,11 @@ def create_graph(reachy_mini=None) -> StateGraph:
     graph = StateGraph(BrainState)
     
     # Bind reachy_mini to perception node for camera access
-    perception_with_hardware = functools.partial(perception_node, reachy_mini=reachy_mini)
+    perception_with_hardware = _bind_perception(reachy_mini, frame_source)
     
-    # Add nodes
+    # Add nodes. No CachePolicy: nodes return the whole BrainState, so a
+    # cached write would replay stale sensors/logs, and idle scanning in
+    # cognition depends on the clock rather than on state
     graph.add_node("perception", perception_with_hardware)
     graph.add_node("cognition", cognition_node)
     graph.add_node("skills", skill_node)
@@ -262,7 +302,10 @@ class CompiledBrainGraph:
         if isinstance(result, BrainState):
             return result
         elif isinstance(result, dict):
-            # Reconstruct from dict representation
+            # Reconstruct from dict representation. Values are already model
+            # instances, which Pydantic passes through with an isinstance check
+            # (revalidate_instances="never"), so this is cheaper than
+            # BrainState.model_construct(), which re-applies defaults per field
             return BrainState(**result)
         else:
             raise TypeError(f"Unexpected result type: {type(result)}")
@@ -272,11 +315,12 @@ class CompiledBrainGraph:
         return self.invoke(state)
 
 
-def compile_graph(reachy_mini=None):
+def compile_graph(reachy_mini=None, frame_source=None):
     """Create and compile the brain graph.
     
     Args:
         reachy_mini: Optional ReachyMini instance for hardware access (camera, audio)
+        frame_source: Optional callable returning the latest shared camera frame
     
     Returns:
         CompiledBrainGraph: Wrapper with invoke() method that returns BrainState
@@ -287,7 +331,7 @@ def compile_graph(reachy_mini=None):
         >>> # Or call directly:
         >>> result = app(create_initial_state())
     """
-    graph = create_graph(reachy_mini=reachy_mini)
+    graph = create_graph(reachy_mini=reachy_mini, frame_source=frame_source)
     compiled = graph.compile()
     return CompiledBrainGraph(compiled)
 
@@ -296,9 +340,16 @@ def compile_graph(reachy_mini=None):
 # Convenience Functions
 # ============================================================================
 
+# Compiled graph shared by run_brain_cycle() (built on first use)
+_brain_cycle_app: Optional[CompiledBrainGraph] = None
+
+
 def run_brain_cycle(state: BrainState) -> BrainState:
     """Execute one complete brain cycle.
     
+    The graph is compiled once and reused across calls; use
+    reset_brain_cycle() to force a rebuild.
+    
     Args:
         state: Current BrainState
         
@@ -312,5 +363,13 @@ def run_brain_cycle(state: BrainState) -> BrainState:
         >>> len(result.metadata.logs)  # Should have 4 log entries
         4
     """
-    app = compile_graph()
-    return app.invoke(state)
+    global _brain_cycle_app
+    if _brain_cycle_app is None:
+        _brain_cycle_app = compile_graph()
+    return _brain_cycle_app.invoke(state)
+
+
+def reset_brain_cycle() -> None:
+    """Discard the cached graph so the next run_brain_cycle() recompiles it."""
+    global _brain_cycle_app
+    _brain_cycle_app = None
@@ -16,7 +16,10 @@ import sys
 from datetime import datetime
 
 from brain.graph import compile_graph, run_brain_cycle
-from brain.models.state import create_initial_state
+from brain.models.state import create_initial_state, log_tags
+
+# Log tags every node writes; checked with one set-subset test
+EXPECTED_LOG_TAGS = frozenset({"Perception", "Cognition", "Skills", "Execution"})
 
 
 def run_brain_demo():
@@ -71,17 +74,14 @@ def run_brain_demo():
     print()
     
     # Validate execution
-    expected_logs = ["Perception node executed", "Cognition node executed", 
-                     "Skill node executed", "Execution node executed"]
-    success = all(any(expected in log for log in result_state.metadata.logs) 
-                  for expected in expected_logs)
+    success = EXPECTED_LOG_TAGS <= log_tags(result_state)
     
     if success:
         print("✅ All nodes executed successfully!")
         print("   Graph orchestration is working correctly.")
     else:
         print("⚠️  Some nodes may not have executed")
-        print(f"   Expected: {expected_logs}")
+        print(f"   Expected: {sorted(EXPECTED_LOG_TAGS)}")
         print(f"   Got: {[log.split(': ')[1] if ': ' in log else log for log in result_state.metadata.logs]}")
     
     print()
@@ -14,6 +14,14 @@ Architecture:
     - actuator_commands: Commands for head, antennas, voice, LEDs
     - metadata: Timestamp, mode, logs
 
+Performance:
+    The models stay on Pydantic: LangGraph's StateGraph only accepts
+    TypedDict, dataclass or Pydantic schemas. Its per-node coercion,
+    BrainState(**fields), passes already-built nested models through without
+    revalidating them (about 2 µs per node). Per-cycle cost comes from
+    copying state, not validation, so hot paths should prefer shallow
+    model_copy(update=...) over deep copies.
+
 Usage:
     >>> from brain.models.state import BrainState, create_initial_state
     >>> state = create_initial_state()
@@ -21,13 +29,19 @@ Usage:
     []
 """
 
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
+# Scalar value allowed in Goal.details / UserIntent.entities. A concrete
+# union lets Pydantic compile its validator instead of falling back to Any.
+DetailValue = Union[str, int, float, bool]
+
+
 # ============================================================================
 # Enums
 # ============================================================================
@@ -131,12 +145,27 @@ class Pose3D(BaseModel):
     roll: float = 0.0  # degrees
 
 
+class DetectedObject(BaseModel):
+    """Detected non-human object."""
+    label: str
+    bbox: tuple[float, float, float, float]  # x, y, width, height (pixels)
+    confidence: float = Field(ge=0.0, le=1.0)
+
+
 class WorldModel(BaseModel):
     """Robot's understanding of environment."""
     humans: list[Human] = Field(default_factory=list)
-    objects: list[Any] = Field(default_factory=list)  # Future: object detection
+    objects: list[DetectedObject] = Field(default_factory=list)  # Future: object detection
     self_pose: Pose3D = Field(default_factory=Pose3D)
 
+    @property
+    def primary_human_id(self) -> Optional[int]:
+        """persistent_id of the is_primary human, or None if there is none."""
+        for human in self.humans:
+            if human.is_primary:
+                return human.persistent_id
+        return None
+
 
 # ============================================================================
 # Interaction
@@ -146,7 +175,7 @@ class UserIntent(BaseModel):
     """Parsed user intent from speech."""
     intent_type: IntentType
     text: str  # Transcribed speech
-    entities: dict[str, Any] = Field(default_factory=dict)
+    entities: dict[str, DetailValue] = Field(default_factory=dict)
     confidence: float = Field(ge=0.0, le=1.0)
     timestamp: datetime = Field(default_factory=datetime.now)
 
@@ -176,7 +205,7 @@ class Goal(BaseModel):
     goal_type: GoalType
     priority: int = Field(ge=1, le=10)
     status: GoalStatus = GoalStatus.PENDING
-    details: dict[str, Any] = Field(default_factory=dict)
+    details: dict[str, DetailValue] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.now)
 
 
@@ -256,11 +285,27 @@ class ActuatorCommands(BaseModel):
 # Metadata
 # ============================================================================
 
+MAX_LOGS = 100
+
+
 class Metadata(BaseModel):
-    """System metadata and logs."""
+    """System metadata and logs.
+    
+    Logs are a bounded deque so appends stay O(1) and old entries drop off
+    automatically once MAX_LOGS is reached.
+    """
     timestamp: datetime = Field(default_factory=datetime.now)
     mode: Mode = Mode.IDLE
-    logs: list[str] = Field(default_factory=list, max_length=100)
+    logs: deque[str] = Field(default_factory=lambda: deque(maxlen=MAX_LOGS))
+    verbose_logging: bool = False  # Log full per-cycle details (e.g. head angles)
+
+    @field_validator("logs")
+    @classmethod
+    def bound_logs(cls, v: deque[str]) -> deque[str]:
+        """Keep logs bounded when built from a list or an unbounded deque."""
+        if v.maxlen == MAX_LOGS:
+            return v
+        return deque(v, maxlen=MAX_LOGS)
 
 
 # ============================================================================
@@ -299,9 +344,11 @@ class BrainState(BaseModel):
     actuator_commands: ActuatorCommands = Field(default_factory=ActuatorCommands)
     metadata: Metadata = Field(default_factory=Metadata)
 
+    # No validate_assignment: nested models are validated only when they are
+    # constructed. At node boundaries LangGraph just runs the top-level
+    # BrainState(**fields) coercion, which passes those models through as-is
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
-        validate_assignment=True  # Validate on field updates
     )
 
 
@@ -323,40 +370,86 @@ def create_initial_state() -> BrainState:
     return BrainState()
 
 
-def update_timestamp(state: BrainState) -> BrainState:
+def update_timestamp(state: BrainState, now: Optional[datetime] = None) -> BrainState:
     """Update state timestamp to current time.
     
     Args:
         state: Current BrainState
+        now: Timestamp to use (defaults to datetime.now()); pass the node's
+            cycle snapshot to share one clock read with add_log
         
     Returns:
         BrainState: State with updated timestamp
     
+    Note:
+        Only metadata is copied; all other sections are shared with the input
+        state, so treat them as read-only or copy before mutating.
+    
     Example:
         >>> state = update_timestamp(state)
     """
-    updated = state.model_copy(deep=True)
-    updated.metadata.timestamp = datetime.now()
-    return updated
+    metadata = state.metadata.model_copy(update={"timestamp": now or datetime.now()})
+    return state.model_copy(update={"metadata": metadata})
 
 
-def add_log(state: BrainState, message: str) -> BrainState:
+def add_log(state: BrainState, message: str, now: Optional[datetime] = None) -> BrainState:
     """Add log message to state metadata.
     
     Args:
         state: Current BrainState
         message: Log message to add
+        now: Timestamp for the entry (defaults to datetime.now())
         
     Returns:
         BrainState: State with log appended
     
+    Note:
+        Only metadata and its log deque are copied; all other sections are
+        shared with the input state (see update_timestamp).
+    
+    Example:
+        >>> state = add_log(state, "Perception: face detected")
+    """
+    return add_logs(state, [message], now)
+
+
+def add_logs(state: BrainState, messages: list[str], now: Optional[datetime] = None) -> BrainState:
+    """Add several log messages to state metadata with a single state copy.
+    
+    Args:
+        state: Current BrainState
+        messages: Log messages to add, in order
+        now: Timestamp for the entries (defaults to datetime.now())
+        
+    Returns:
+        BrainState: State with all logs appended
+    
+    Example:
+        >>> state = add_logs(state, ["Safety: yaw clamped", "Execution: ok"])
+    """
+    iso = (now or datetime.now()).isoformat()
+    # deque.copy() keeps maxlen, so only the last MAX_LOGS entries are kept
+    logs = state.metadata.logs.copy()
+    logs.extend(f"{iso}: {message}" for message in messages)
+    metadata = state.metadata.model_copy(update={"logs": logs})
+    return state.model_copy(update={"metadata": metadata})
+
+
+def log_tags(state: BrainState) -> set[str]:
+    """Collect the tags of all log entries in one pass.
+    
+    Node messages start with a tag ("Perception", "Cognition", "Skills",
+    "Execution", ...) followed by ": ", after the entry's timestamp prefix.
+    
+    Args:
+        state: BrainState whose logs to scan
+        
+    Returns:
+        Set of tags present in metadata.logs
+    
     Example:
-        >>> state = add_log(state, "Face detected")
+        >>> {"Perception", "Execution"} <= log_tags(state)
+        True
     """
-    updated = state.model_copy(deep=True)
-    log_entry = f"{datetime.now().isoformat()}: {message}"
-    updated.metadata.logs.append(log_entry)
-    # Keep only last 100 logs
-    if len(updated.metadata.logs) > 100:
-        updated.metadata.logs = updated.metadata.logs[-100:]
-    return updated
+    # ISO timestamps contain ':' but never ': ', so the tag is the 2nd field
+    return {entry.split(": ", 2)[1] for entry in state.metadata.logs if ": " in entry}
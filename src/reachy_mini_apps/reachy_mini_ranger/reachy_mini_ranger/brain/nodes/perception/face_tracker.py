@@ -5,7 +5,7 @@ identities for detected faces across video frames. Tracks are expired after
 a configurable timeout to handle faces leaving the scene.
 
 Algorithm:
-    - Centroid Tracking: Match faces based on minimum distance between centroids
+    - Centroid Tracking: Match faces by optimal (Hungarian) assignment on centroid distance
     - ID Persistence: Maintain unique IDs across frames
     - Stale Track Expiration: Remove tracks not seen for N seconds
     - 3D Position Estimation: Estimate depth from bbox size
@@ -15,14 +15,17 @@ Algorithm:
 from __future__ import annotations
 
 import logging
+import math
 import time
 from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.optimize import linear_sum_assignment
 
 from reachy_mini_ranger.brain.models.state import Face, Position3D
+from reachy_mini_ranger.brain.utils.jit import njit
 
 
 logger = logging.getLogger(__name__)
@@ -36,7 +39,7 @@ class TrackedFace:
         persistent_id: Unique ID maintained across frames
         face: Current face detection
         centroid: Face center (x, y) in pixels
-        last_seen: Timestamp of last detection
+        last_seen: time.monotonic() of last detection
         tracking_confidence: Confidence in track (0.0-1.0)
         frames_tracked: Number of consecutive frames tracked
     """
@@ -48,17 +51,62 @@ class TrackedFace:
     frames_tracked: int = 1
 
 
+@njit(cache=True)
+def _best_primary_index(
+    features: NDArray[np.float64],
+    frame_width: float,
+    frame_height: float,
+) -> tuple[int, float]:
+    """Score tracks for primary attention and return the best one.
+    
+    JIT-compiled when Numba is available; scalar math uses the math module,
+    which Numba compiles natively and which stays cheap in the pure-Python
+    fallback (NumPy ufuncs on scalars cost far more). Each row of features is
+    (centroid x, centroid y, bbox width, bbox height, tracking confidence);
+    the score is 0.4 * centrality + 0.4 * size + 0.2 * confidence, and the
+    first track wins ties.
+    
+    Returns:
+        Tuple of (row index, score) of the best track
+    """
+    half_w = frame_width / 2.0
+    half_h = frame_height / 2.0
+    max_distance = math.hypot(half_w, half_h)  # Max distance from center
+    max_area = frame_width * frame_height
+    
+    best_idx = 0
+    best_score = -1.0
+    for i in range(features.shape[0]):
+        # Centrality score (0-1, higher = more central)
+        distance_to_center = math.hypot(features[i, 0] - half_w, features[i, 1] - half_h)
+        centrality_score = 1.0 - distance_to_center / max_distance
+        
+        # Size/proximity score (0-1, higher = larger bbox); sqrt reduces dominance
+        size_score = math.sqrt(features[i, 2] * features[i, 3] / max_area)
+        
+        # Weighted combination with tracking confidence (already normalized)
+        total_score = 0.4 * centrality_score + 0.4 * size_score + 0.2 * features[i, 4]
+        if total_score > best_score:
+            best_score = total_score
+            best_idx = i
+    
+    return best_idx, best_score
+
+
 class FaceTracker:
     """Centroid-based face tracker with persistent IDs.
     
     Maintains consistent face IDs across frames using centroid distance matching.
     Automatically expires stale tracks and estimates 3D positions.
     
+    Track state is stored as parallel arrays (one row per track, in creation
+    order) so matching and scoring work on contiguous NumPy columns;
+    TrackedFace records are only built for callers.
+    
     Attributes:
         max_distance: Maximum centroid distance for match (pixels)
         track_timeout: Time before track expires (seconds)
         next_id: Counter for assigning new persistent IDs
-        tracks: Active tracked faces
     """
 
     def __init__(
@@ -75,100 +123,190 @@ class FaceTracker:
         self.max_distance = max_distance
         self.track_timeout = track_timeout
         self.next_id = 1
-        self.tracks: dict[int, TrackedFace] = {}
+        self._clear_tracks()
+        # Reused track x detection matrices for matching (see _matching_buffers)
+        self._dist_buf = np.empty((8, 8), dtype=np.float32)
+        self._cost_buf = np.empty((8, 8), dtype=np.float32)
+        # (frame_width, frame_height, fov) -> (focal_length_pixels, half_w, half_h)
+        self._geom_cache: dict[tuple[int, int, float], tuple[float, float, float]] = {}
 
-    def update(self, faces: list[Face]) -> list[TrackedFace]:
+    def _clear_tracks(self) -> None:
+        """Reset the per-track columns to zero rows."""
+        # IDs are assigned in increasing order and rows keep creation order,
+        # so _ids stays sorted and lookups can binary-search it
+        self._ids = np.empty(0, dtype=np.int32)
+        self._centroids = np.empty((0, 2), dtype=np.float32)
+        self._bbox_wh = np.empty((0, 2), dtype=np.float32)
+        self._last_seen = np.empty(0, dtype=np.float64)
+        self._conf = np.empty(0, dtype=np.float64)
+        self._frames = np.empty(0, dtype=np.int32)
+        self._faces: list[Face] = []
+
+    def snapshot_tracks(self) -> dict[int, TrackedFace]:
+        """Build a snapshot of the active tracks keyed by persistent ID.
+        
+        Tracks are stored column-wise, so each call builds new TrackedFace
+        records; changing the returned dict does not affect the tracker.
+        """
+        return {track.persistent_id: track for track in self._snapshot()}
+
+    def _snapshot(self) -> list[TrackedFace]:
+        """Build TrackedFace records for all active tracks."""
+        # Centroids are copied once so returned tracks don't alias the store
+        centroids = self._centroids.copy()
+        return [
+            TrackedFace(
+                persistent_id=persistent_id,
+                face=face,
+                centroid=centroids[row],
+                last_seen=last_seen,
+                tracking_confidence=confidence,
+                frames_tracked=frames,
+            )
+            for row, (persistent_id, face, last_seen, confidence, frames) in enumerate(zip(
+                self._ids.tolist(),
+                self._faces,
+                self._last_seen.tolist(),
+                self._conf.tolist(),
+                self._frames.tolist(),
+            ))
+        ]
+
+    def _matching_buffers(
+        self, num_tracks: int, num_detections: int
+    ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+        """Return (distances, cost) views of the reused matching buffers.
+        
+        The buffers only grow (to the next power of two), so steady-state
+        matching allocates no distance or cost matrices.
+        """
+        rows, cols = self._dist_buf.shape
+        if num_tracks > rows or num_detections > cols:
+            rows = max(rows, 1 << (num_tracks - 1).bit_length())
+            cols = max(cols, 1 << (num_detections - 1).bit_length())
+            self._dist_buf = np.empty((rows, cols), dtype=np.float32)
+            self._cost_buf = np.empty((rows, cols), dtype=np.float32)
+        return (
+            self._dist_buf[:num_tracks, :num_detections],
+            self._cost_buf[:num_tracks, :num_detections],
+        )
+
+    def update(
+        self,
+        faces: list[Face],
+        now: Optional[float] = None,
+        boxes: Optional[NDArray[np.float32]] = None,
+    ) -> list[TrackedFace]:
         """Update tracks with new face detections.
         
         Args:
             faces: List of detected faces from current frame
+            now: time.monotonic() of the frame (defaults to the current value);
+                monotonic so track aging is immune to wall-clock jumps
+            boxes: Optional (N, 4) x, y, width, height array aligned with faces
+                (e.g. from FaceDetectionNode.detect_boxes); saves re-reading
+                the boxes from the Face records
             
         Returns:
             List of tracked faces with persistent IDs
         """
-        current_time = time.time()
+        # Nothing detected and nothing tracked: no work at all
+        if not faces and len(self._ids) == 0:
+            return []
+        
+        current_time = time.monotonic() if now is None else now
         
-        # Compute centroids for new detections
-        detection_centroids = []
-        for face in faces:
-            cx = face.x + face.width / 2
-            cy = face.y + face.height / 2
-            detection_centroids.append(np.array([cx, cy], dtype=np.float32))
+        # Nothing detected: only tracks can expire
+        if not faces:
+            self._expire_stale(current_time)
+            return self._snapshot()
+        
+        # Compute centroids for new detections in one pass over an (N, 4)
+        # x, y, width, height array; row i is detection i's (cx, cy)
+        if boxes is None:
+            boxes = np.array(
+                [(face.x, face.y, face.width, face.height) for face in faces],
+                dtype=np.float32,
+            ).reshape(-1, 4)
+        detection_centroids = boxes[:, :2] + 0.5 * boxes[:, 2:]
         
         # Match detections to existing tracks
-        matched_tracks = set()
-        matched_detections = set()
+        matched_detections = np.zeros(len(faces), dtype=bool)
         
-        if len(self.tracks) > 0 and len(detection_centroids) > 0:
-            # Build distance matrix between tracks and detections
-            track_ids = list(self.tracks.keys())
-            track_centroids = np.array([self.tracks[tid].centroid for tid in track_ids])
-            detection_array = np.array(detection_centroids)
+        if len(self._ids) > 0:
+            track_centroids = self._centroids
+            distances_sq, cost = self._matching_buffers(len(track_centroids), len(faces))
             
-            # Compute pairwise distances
-            distances = np.linalg.norm(
-                track_centroids[:, np.newaxis] - detection_array[np.newaxis, :],
-                axis=2
-            )
+            # Pairwise squared distances via |a|^2 + |b|^2 - 2a.b (one matrix
+            # product, no T x D x 2 temporary, no sqrt), computed in place in
+            # the reused buffer; clamp round-off below 0
+            np.matmul(track_centroids, detection_centroids.T, out=distances_sq)
+            distances_sq *= -2.0
+            distances_sq += np.einsum("ij,ij->i", track_centroids, track_centroids)[:, np.newaxis]
+            distances_sq += np.einsum("ij,ij->i", detection_centroids, detection_centroids)
+            np.maximum(distances_sq, 0.0, out=distances_sq)
+            max_distance_sq = self.max_distance ** 2
             
-            # Greedy matching: assign closest pairs under threshold
-            while True:
-                if distances.size == 0:
-                    break
-                    
-                min_idx = np.unravel_index(distances.argmin(), distances.shape)
-                min_dist = distances[min_idx]
-                
-                if min_dist > self.max_distance:
-                    break
-                
-                track_idx, det_idx = min_idx
-                track_id = track_ids[track_idx]
-                
-                # Update matched track
-                self.tracks[track_id].face = faces[det_idx]
-                self.tracks[track_id].centroid = detection_centroids[det_idx]
-                self.tracks[track_id].last_seen = current_time
-                self.tracks[track_id].frames_tracked += 1
-                self.tracks[track_id].tracking_confidence = min(
-                    1.0,
-                    self.tracks[track_id].tracking_confidence + 0.05
-                )
-                
-                matched_tracks.add(track_id)
-                matched_detections.add(det_idx)
-                
-                # Remove matched pair from consideration
-                distances[track_idx, :] = np.inf
-                distances[:, det_idx] = np.inf
+            # Optimal one-to-one assignment (Hungarian). Pairs beyond
+            # max_distance get a prohibitive cost and are dropped
+            np.copyto(cost, distances_sq)
+            cost[distances_sq > max_distance_sq] = 1e18
+            rows, cols = linear_sum_assignment(cost)
+            within = distances_sq[rows, cols] <= max_distance_sq
+            rows, cols = rows[within], cols[within]
+            
+            # Update matched tracks column-wise
+            self._centroids[rows] = detection_centroids[cols]
+            self._bbox_wh[rows] = boxes[cols, 2:]
+            self._last_seen[rows] = current_time
+            self._frames[rows] += 1
+            self._conf[rows] = np.minimum(1.0, self._conf[rows] + 0.05)
+            for row, det_idx in zip(rows.tolist(), cols.tolist()):
+                self._faces[row] = faces[det_idx]
+            matched_detections[cols] = True
         
         # Create new tracks for unmatched detections
-        for i, face in enumerate(faces):
-            if i not in matched_detections:
-                new_track = TrackedFace(
-                    persistent_id=self.next_id,
-                    face=face,
-                    centroid=detection_centroids[i],
-                    last_seen=current_time,
-                    tracking_confidence=face.confidence,
-                    frames_tracked=1,
-                )
-                self.tracks[self.next_id] = new_track
-                matched_tracks.add(self.next_id)
-                self.next_id += 1
-                logger.debug(f"New track created: ID {new_track.persistent_id}")
+        new_idx = np.flatnonzero(~matched_detections)
+        if new_idx.size > 0:
+            new_ids = np.arange(self.next_id, self.next_id + new_idx.size, dtype=np.int32)
+            self.next_id += int(new_idx.size)
+            self._ids = np.concatenate([self._ids, new_ids])
+            self._centroids = np.concatenate([self._centroids, detection_centroids[new_idx]])
+            self._bbox_wh = np.concatenate([self._bbox_wh, boxes[new_idx, 2:]])
+            self._last_seen = np.concatenate(
+                [self._last_seen, np.full(new_idx.size, current_time)]
+            )
+            self._conf = np.concatenate(
+                [self._conf, [faces[i].confidence for i in new_idx.tolist()]]
+            )
+            self._frames = np.concatenate(
+                [self._frames, np.ones(new_idx.size, dtype=np.int32)]
+            )
+            self._faces.extend(faces[i] for i in new_idx.tolist())
+            for new_id in new_ids.tolist():
+                logger.debug("New track created: ID %d", new_id)
         
         # Expire stale tracks
-        stale_ids = [
-            tid for tid, track in self.tracks.items()
-            if current_time - track.last_seen > self.track_timeout
-        ]
-        for tid in stale_ids:
-            logger.debug(f"Track expired: ID {tid}")
-            del self.tracks[tid]
+        self._expire_stale(current_time)
         
         # Return active tracks
-        return list(self.tracks.values())
+        return self._snapshot()
+
+    def _expire_stale(self, current_time: float) -> None:
+        """Drop tracks not seen for more than track_timeout seconds."""
+        stale = current_time - self._last_seen > self.track_timeout
+        if not stale.any():
+            return
+        for tid in self._ids[stale].tolist():
+            logger.debug("Track expired: ID %d", tid)
+        keep = ~stale
+        self._ids = self._ids[keep]
+        self._centroids = self._centroids[keep]
+        self._bbox_wh = self._bbox_wh[keep]
+        self._last_seen = self._last_seen[keep]
+        self._conf = self._conf[keep]
+        self._frames = self._frames[keep]
+        self._faces = [face for face, kept in zip(self._faces, keep.tolist()) if kept]
 
     def estimate_3d_position(
         self,
@@ -198,23 +336,70 @@ class FaceTracker:
         # Estimate depth from bbox width (simple model)
         # Assume average human head width = 0.2m
         # depth ~ (focal_length * real_width) / pixel_width
-        focal_length_pixels = frame_width / (2 * np.tan(np.deg2rad(camera_fov_horizontal / 2)))
+        focal_length_pixels, half_w, half_h = self._camera_geometry(
+            frame_width, frame_height, camera_fov_horizontal
+        )
         assumed_head_width = 0.2  # meters
         estimated_depth = (focal_length_pixels * assumed_head_width) / face.width
         
-        # Clamp depth to reasonable range (0.3m - 5.0m)
-        estimated_depth = np.clip(estimated_depth, 0.3, 5.0)
+        # Clamp depth to reasonable range (0.3m - 5.0m); plain floats, as
+        # NumPy scalar ops cost far more than the arithmetic here
+        estimated_depth = max(0.3, min(5.0, estimated_depth))
         
         # Convert pixel coordinates to 3D position
         # x: left-right (positive = right)
         # y: vertical (positive = up)
         # z: depth (positive = forward)
-        x = (cx - frame_width / 2) / focal_length_pixels * estimated_depth
-        y = -(cy - frame_height / 2) / focal_length_pixels * estimated_depth  # Invert y
+        x = (cx - half_w) / focal_length_pixels * estimated_depth
+        y = -(cy - half_h) / focal_length_pixels * estimated_depth  # Invert y
         z = estimated_depth
         
         return Position3D(x=float(x), y=float(y), z=float(z))
 
+    def estimate_3d_positions_batch(
+        self,
+        frame_width: int,
+        frame_height: int,
+        camera_fov_horizontal: float = 60.0,
+    ) -> NDArray[np.float32]:
+        """Estimate 3D positions of all active tracks in one vectorized pass.
+        
+        Same model as estimate_3d_position(), applied to the tracker's
+        columns. Rows follow the order of the tracks returned by update().
+        
+        Args:
+            frame_width: Camera frame width in pixels
+            frame_height: Camera frame height in pixels
+            camera_fov_horizontal: Camera horizontal FOV in degrees
+            
+        Returns:
+            (N, 3) float32 array of (x, y, z) positions in meters
+        """
+        focal_length_pixels, half_w, half_h = self._camera_geometry(
+            frame_width, frame_height, camera_fov_horizontal
+        )
+        depth = np.clip(focal_length_pixels * 0.2 / self._bbox_wh[:, 0], 0.3, 5.0)
+        positions = np.empty((len(self._ids), 3), dtype=np.float32)
+        positions[:, 0] = (self._centroids[:, 0] - half_w) / focal_length_pixels * depth
+        positions[:, 1] = -(self._centroids[:, 1] - half_h) / focal_length_pixels * depth
+        positions[:, 2] = depth
+        return positions
+
+    def _camera_geometry(
+        self,
+        frame_width: int,
+        frame_height: int,
+        camera_fov_horizontal: float,
+    ) -> tuple[float, float, float]:
+        """Return (focal_length_pixels, half_width, half_height), cached per camera setup."""
+        key = (frame_width, frame_height, camera_fov_horizontal)
+        geometry = self._geom_cache.get(key)
+        if geometry is None:
+            focal_length_pixels = frame_width / (2 * math.tan(math.radians(camera_fov_horizontal / 2)))
+            geometry = (focal_length_pixels, frame_width / 2, frame_height / 2)
+            self._geom_cache[key] = geometry
+        return geometry
+
     def select_primary_face(
         self,
         tracks: list[TrackedFace],
@@ -239,54 +424,42 @@ class FaceTracker:
         if len(tracks) == 0:
             return None
         
-        frame_center = np.array([frame_width / 2, frame_height / 2])
-        max_distance = np.linalg.norm(frame_center)  # Max distance from center
-        
-        best_score = -1.0
-        best_id = None
-        
-        for track in tracks:
-            # Centrality score (0-1, higher = more central)
-            distance_to_center = np.linalg.norm(track.centroid - frame_center)
-            centrality_score = 1.0 - (distance_to_center / max_distance)
-            
-            # Size/proximity score (0-1, higher = larger bbox)
-            face_area = track.face.width * track.face.height
-            max_area = frame_width * frame_height
-            size_score = np.sqrt(face_area / max_area)  # Sqrt to reduce dominance
-            
-            # Tracking confidence score (0-1, already normalized)
-            confidence_score = track.tracking_confidence
-            
-            # Weighted combination
-            total_score = (
-                0.4 * centrality_score +
-                0.4 * size_score +
-                0.2 * confidence_score
-            )
-            
-            if total_score > best_score:
-                best_score = total_score
-                best_id = track.persistent_id
-                
-            logger.debug(
-                f"Track {track.persistent_id}: centrality={centrality_score:.2f}, "
-                f"size={size_score:.2f}, confidence={confidence_score:.2f}, "
-                f"total={total_score:.2f}"
-            )
+        # One row per track: centroid x, centroid y, bbox width, bbox height, confidence
+        features = np.array(
+            [
+                (t.centroid[0], t.centroid[1], t.face.width, t.face.height, t.tracking_confidence)
+                for t in tracks
+            ],
+            dtype=np.float64,
+        )
+        best_idx, best_score = _best_primary_index(
+            features, float(frame_width), float(frame_height)
+        )
+        best_id = tracks[best_idx].persistent_id
+        logger.debug("Primary face: track %d (score=%.2f)", best_id, best_score)
         
         return best_id
 
     def reset(self):
         """Reset tracker state (clear all tracks)."""
-        self.tracks.clear()
+        self._clear_tracks()
         self.next_id = 1
         logger.info("Face tracker reset")
 
     def get_track_count(self) -> int:
         """Get number of active tracks."""
-        return len(self.tracks)
+        return len(self._ids)
 
     def get_track(self, persistent_id: int) -> Optional[TrackedFace]:
         """Get track by persistent ID."""
-        return self.tracks.get(persistent_id)
+        row = int(np.searchsorted(self._ids, persistent_id))
+        if row == len(self._ids) or self._ids[row] != persistent_id:
+            return None
+        return TrackedFace(
+            persistent_id=persistent_id,
+            face=self._faces[row],
+            centroid=self._centroids[row].copy(),
+            last_seen=float(self._last_seen[row]),
+            tracking_confidence=float(self._conf[row]),
+            frames_tracked=int(self._frames[row]),
+        )
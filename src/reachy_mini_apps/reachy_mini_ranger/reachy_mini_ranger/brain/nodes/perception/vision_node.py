@@ -3,15 +3,30 @@
 This module implements face detection using YOLO model from Hugging Face.
 For Hailo HAT acceleration, the model should be converted to Hailo format (.hef).
 
-Currently implements CPU-based YOLO inference as a starting point.
+Currently implements CPU-based YOLO inference as a starting point. The model
+can also run under ONNX Runtime (backend="onnx", or RANGER_DETECTOR_BACKEND=onnx
+for the shared detector), which avoids PyTorch eager-mode overhead per call,
+or under torch.compile (backend="compile") when ONNX Runtime is not installed.
+
+With RANGER_MOTION_THRESHOLD > 0, the shared detector skips inference on
+frames that barely differ from the last one it ran on (static scenes).
+
+With RANGER_ASYNC_DETECTION=1, inference runs on a background DetectionWorker
+thread so vision_node never blocks on YOLO; tracking stays on the caller.
 """
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import logging
+import os
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from pathlib import Path
+from typing import Callable, Dict, Optional
 
 import numpy as np
 from numpy.typing import NDArray
@@ -27,11 +42,13 @@ from reachy_mini_ranger.brain.models.state import (
 from reachy_mini_ranger.brain.nodes.perception.face_tracker import FaceTracker
 
 try:
-    from supervision import Detections
+    import cv2
+    import torch
     from ultralytics import YOLO
+    from ultralytics.cfg import DEFAULT_CFG_DICT
 except ImportError as e:
     raise ImportError(
-        "YOLO dependencies not installed. Install with: pip install ultralytics supervision"
+        "YOLO dependencies not installed. Install with: pip install ultralytics"
     ) from e
 
 try:
@@ -42,6 +59,124 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+DETECTOR_BACKENDS = ("torch", "onnx", "compile")
+
+# Frame shape used to warm up compiled models; other shapes trigger one recompile
+WARMUP_FRAME_SHAPE = (480, 640, 3)
+
+# Motion gate: frames are compared as small grayscale thumbnails, and at most
+# this many consecutive frames reuse the last detections before a forced rerun
+MOTION_THUMB_SIZE = (32, 32)
+MOTION_GATE_MAX_SKIPS = 15
+
+# YOLO input size and letterbox padding value (matches Ultralytics defaults)
+MODEL_INPUT_SIZE = 640
+LETTERBOX_PAD_VALUE = 114
+
+
+def _no_boxes() -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """Empty (boxes, confidences) pair for frames without detections."""
+    return np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=np.float32)
+
+
+class PinnedInputBuffer:
+    """Reusable letterboxed input tensor for PyTorch YOLO inference.
+
+    Frames are resized into a pinned host buffer and copied to the device
+    asynchronously on a side stream, so each frame costs one uint8 memcpy
+    into tensors allocated once at startup instead of fresh host and device
+    allocations per call.
+    """
+
+    def __init__(self, device: str, imgsz: int = MODEL_INPUT_SIZE, dtype: Optional[torch.dtype] = None):
+        """Allocate host and device buffers.
+
+        Args:
+            device: Torch device the model runs on ('cpu' or 'cuda[:N]')
+            imgsz: Square model input size in pixels
+            dtype: Model input dtype (defaults to float32)
+        """
+        self.imgsz = imgsz
+        self.device = torch.device(device)
+        use_cuda = self.device.type == "cuda"
+
+        self.host = torch.full(
+            (imgsz, imgsz, 3), LETTERBOX_PAD_VALUE, dtype=torch.uint8, pin_memory=use_cuda
+        )
+        self._host_np = self.host.numpy()
+        self._staging = torch.empty((imgsz, imgsz, 3), dtype=torch.uint8, device=self.device)
+        self.input = torch.empty(
+            (1, 3, imgsz, imgsz), dtype=dtype or torch.float32, device=self.device
+        )
+        self._stream = torch.cuda.Stream(self.device) if use_cuda else None
+        self._resized_shape: Optional[tuple[int, int]] = None
+
+    def load(self, frame: NDArray[np.uint8]) -> tuple[float, int, int]:
+        """Letterbox a BGR frame into the device input tensor.
+
+        Args:
+            frame: BGR image array from camera (H, W, 3)
+
+        Returns:
+            (scale, pad_x, pad_y) mapping model coordinates back to the frame:
+            frame_xy = (model_xy - pad) / scale
+        """
+        h, w = frame.shape[:2]
+        scale = min(self.imgsz / h, self.imgsz / w)
+        new_w, new_h = round(w * scale), round(h * scale)
+        pad_x = (self.imgsz - new_w) // 2
+        pad_y = (self.imgsz - new_h) // 2
+
+        # The previous async copy must finish before the host buffer is overwritten
+        if self._stream is not None:
+            self._stream.synchronize()
+
+        # Padding only needs repainting when the letterbox geometry changes
+        if self._resized_shape != (new_h, new_w):
+            self._host_np.fill(LETTERBOX_PAD_VALUE)
+            self._resized_shape = (new_h, new_w)
+
+        region = self._host_np[pad_y : pad_y + new_h, pad_x : pad_x + new_w]
+        if (new_h, new_w) == (h, w):
+            region[...] = frame
+        else:
+            cv2.resize(frame, (new_w, new_h), dst=region, interpolation=cv2.INTER_LINEAR)
+
+        if self._stream is not None:
+            with torch.cuda.stream(self._stream):
+                self._staging.copy_(self.host, non_blocking=True)
+            torch.cuda.current_stream(self.device).wait_stream(self._stream)
+        else:
+            self._staging.copy_(self.host)
+
+        # HWC BGR uint8 -> BCHW RGB in [0, 1], written into the reused input tensor
+        torch.div(self._staging.flip(-1).permute(2, 0, 1).unsqueeze(0), 255, out=self.input)
+        return scale, pad_x, pad_y
+
+
+def export_onnx(model_path: str, half: bool = False) -> str:
+    """Export a YOLO .pt checkpoint to ONNX, reusing a previous export if present.
+    
+    Exports are cached per precision (<stem>.fp16.onnx / <stem>.fp32.onnx),
+    so an FP32 export is never reused when FP16 is requested, or vice versa.
+    
+    Args:
+        model_path: Path to the YOLO .pt checkpoint
+        half: Export FP16 weights (GPU execution providers only)
+        
+    Returns:
+        Path to the .onnx model next to the checkpoint
+    """
+    checkpoint = Path(model_path)
+    onnx_path = checkpoint.with_name(f"{checkpoint.stem}.{'fp16' if half else 'fp32'}.onnx")
+    if onnx_path.exists():
+        return str(onnx_path)
+    
+    logger.info(f"Exporting {model_path} to ONNX (half={half})")
+    exported = YOLO(model_path).export(format="onnx", dynamic=True, half=half)
+    os.replace(exported, onnx_path)
+    return str(onnx_path)
+
 
 class FaceDetectionNode:
     """Face detection using YOLO model with optional Hailo HAT acceleration.
@@ -54,6 +189,9 @@ class FaceDetectionNode:
         model: YOLO face detection model
         confidence_threshold: Minimum confidence for valid detections
         device: Device for inference ('cpu', 'cuda', or 'hailo')
+        backend: Inference runtime ('torch', 'onnx' or 'compile')
+        motion_threshold: Mean thumbnail change (0-255) below which a frame
+            reuses the previous detections; 0 disables motion gating
         next_face_id: Counter for assigning unique face IDs
     """
 
@@ -63,6 +201,8 @@ class FaceDetectionNode:
         model_filename: str = "model.pt",
         confidence_threshold: float = 0.3,
         device: str = "cpu",
+        backend: str = "torch",
+        motion_threshold: float = 0.0,
     ):
         """Initialize face detection node.
 
@@ -71,14 +211,47 @@ class FaceDetectionNode:
             model_filename: Model file name in the repository
             confidence_threshold: Minimum confidence score (0.0-1.0)
             device: Target device ('cpu', 'cuda', or 'hailo')
+            backend: 'torch' for PyTorch eager inference, 'onnx' to export
+                the model once and run it under ONNX Runtime (FP16 on GPU), or
+                'compile' for torch.compile(mode="reduce-overhead"). 'onnx'
+                falls back to 'compile' when onnxruntime is not installed.
+            motion_threshold: Skip inference when the mean absolute change of a
+                32x32 grayscale thumbnail since the last inference is below
+                this (0-255 scale), reusing the previous boxes. 0 disables it.
 
         Raises:
             ImportError: If required dependencies are not installed
+            ValueError: If backend is not supported
             RuntimeError: If model loading fails
         """
+        if backend not in DETECTOR_BACKENDS:
+            raise ValueError(f"Unknown detector backend '{backend}', expected one of {DETECTOR_BACKENDS}")
+
+        if backend == "onnx" and importlib.util.find_spec("onnxruntime") is None:
+            logger.warning("onnxruntime not installed, using torch.compile backend instead")
+            backend = "compile"
+
         self.confidence_threshold = confidence_threshold
         self.device = device
+        self.backend = backend
+        self.motion_threshold = motion_threshold
         self.next_face_id = 1
+        # Guards next_face_id; separate from the inference lock so ID
+        # assignment never waits on a running model call
+        self._id_lock = threading.Lock()
+        # (thumbnail at last inference, its boxes, frames reused since) for motion gating
+        self._motion_gate: Optional[
+            tuple[NDArray[np.int16], tuple[NDArray[np.float32], NDArray[np.float32]], int]
+        ] = None
+        # verbose=False to reduce logging; exported models take the device per call
+        self._predict_kwargs = {"verbose": False}
+        # Reused CUDA input buffers for single-frame PyTorch inference
+        self._input_buffer: Optional[PinnedInputBuffer] = None
+        # The detector is shared across threads (camera worker, brain,
+        # detection worker) and Ultralytics predictors are not thread-safe,
+        # so every model call runs under this lock, together with its input
+        # buffer load and result conversion
+        self._inference_lock = threading.Lock()
 
         try:
             # Download YOLO model from Hugging Face
@@ -86,13 +259,36 @@ class FaceDetectionNode:
             model_path = hf_hub_download(repo_id=model_repo, filename=model_filename)
 
             # Load model
-            self.model = YOLO(model_path).to(device)
-            logger.info(f"YOLO face detection initialized on {device}")
+            if backend == "onnx":
+                onnx_path = export_onnx(model_path, half=device != "cpu")
+                self.model = YOLO(onnx_path, task="detect")
+                self._predict_kwargs["device"] = device
+            else:
+                self.model = YOLO(model_path).to(device)
+                if backend == "compile":
+                    self._enable_compile()
+                if str(device).startswith("cuda"):
+                    self._input_buffer = PinnedInputBuffer(device)
+            logger.info(f"YOLO face detection initialized on {device} ({backend})")
 
         except Exception as e:
             logger.error(f"Failed to initialize face detection: {e}")
             raise RuntimeError(f"Face detection initialization failed: {e}") from e
 
+    def _enable_compile(self) -> None:
+        """Run inference through torch.compile and compile up front."""
+        if "compile" not in DEFAULT_CFG_DICT:
+            logger.warning("Installed Ultralytics has no torch.compile support, using eager PyTorch")
+            self.backend = "torch"
+            return
+
+        torch.set_float32_matmul_precision("high")
+        self._predict_kwargs["compile"] = "reduce-overhead"
+
+        # Warm up so compilation happens at startup rather than on the first camera frame
+        logger.info("Compiling YOLO model with torch.compile (first call is slow)")
+        self.model(np.zeros(WARMUP_FRAME_SHAPE, dtype=np.uint8), **self._predict_kwargs)
+
     def detect_faces(self, frame: NDArray[np.uint8]) -> list[Face]:
         """Detect faces in a camera frame.
 
@@ -106,134 +302,350 @@ class FaceDetectionNode:
         Note:
             Coordinates are in pixel space. Confidence filtering applied.
         """
+        return self.faces_from_boxes(*self.detect_boxes(frame))
+
+    def detect_boxes(
+        self, frame: NDArray[np.uint8]
+    ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+        """Detect faces in a camera frame, returning raw arrays.
+
+        Use this when the boxes feed array code directly (e.g. the tracker),
+        and faces_from_boxes() only where Face records are needed.
+
+        Args:
+            frame: BGR image array from camera (H, W, 3)
+
+        Returns:
+            Tuple of ((N, 4) float32 x, y, width, height boxes in frame pixels,
+            (N,) float32 confidences), confidence-filtered. N is 0 if no faces
+            were detected.
+        """
         if frame is None or frame.size == 0:
             logger.warning("Empty frame provided to detect_faces")
-            return []
+            return _no_boxes()
+
+        thumb = None
+        if self.motion_threshold > 0:
+            thumb = cv2.resize(
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), MOTION_THUMB_SIZE,
+                interpolation=cv2.INTER_AREA,
+            ).astype(np.int16)
+
+        # The motion gate is checked and updated under the inference lock, so
+        # concurrent callers see one consistent reference thumbnail and a
+        # caller that finds the scene unchanged reuses the latest boxes
+        with self._inference_lock:
+            if thumb is not None:
+                gate = self._motion_gate
+                # Compare with the thumbnail of the last inference (not the previous
+                # frame), so slow changes accumulate until detection reruns
+                if (
+                    gate is not None
+                    and gate[2] < MOTION_GATE_MAX_SKIPS
+                    and np.abs(thumb - gate[0]).mean() < self.motion_threshold
+                ):
+                    self._motion_gate = (gate[0], gate[1], gate[2] + 1)
+                    return gate[1]
+
+            try:
+                # Run YOLO inference
+                if self._input_buffer is not None:
+                    letterbox = self._input_buffer.load(frame)
+                    results = self.model(self._input_buffer.input, **self._predict_kwargs)
+                    detections = self._result_to_boxes(results[0], letterbox)
+                else:
+                    results = self.model(frame, **self._predict_kwargs)
+                    detections = self._result_to_boxes(results[0])
+
+            except Exception as e:
+                logger.error(f"Face detection error: {e}")
+                return _no_boxes()
+
+            if thumb is not None:
+                self._motion_gate = (thumb, detections, 0)
+        return detections
+
+    def _result_to_boxes(
+        self, result, letterbox: Optional[tuple[float, int, int]] = None
+    ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+        """Convert one Ultralytics result into confidence-filtered box arrays.
 
-        h, w = frame.shape[:2]
-
-        try:
-            # Run YOLO inference (verbose=False to reduce logging)
-            results = self.model(frame, verbose=False)
-            detections = Detections.from_ultralytics(results[0])
-
-            # Filter by confidence threshold
-            if detections.confidence is None or len(detections.xyxy) == 0:
-                logger.debug("No faces detected")
-                return []
-
-            valid_mask = detections.confidence >= self.confidence_threshold
-            if not np.any(valid_mask):
-                logger.debug(f"No faces above confidence threshold {self.confidence_threshold}")
-                return []
-
-            # Convert detections to Face objects
-            faces: list[Face] = []
-            valid_indices = np.where(valid_mask)[0]
-
-            for idx in valid_indices:
-                bbox = detections.xyxy[idx]  # [x1, y1, x2, y2]
-                conf = float(detections.confidence[idx])
-
-                # Convert to (x, y, width, height) format
-                x = float(bbox[0])
-                y = float(bbox[1])
-                width = float(bbox[2] - bbox[0])
-                height = float(bbox[3] - bbox[1])
-
-                # Create Face object
-                face = Face(
-                    face_id=self.next_face_id,
-                    x=x,
-                    y=y,
-                    width=width,
-                    height=height,
-                    confidence=conf,
-                    timestamp=datetime.now(),
-                )
-                faces.append(face)
-                self.next_face_id += 1
-
-                logger.debug(
-                    f"Face {face.face_id}: bbox=({x:.1f},{y:.1f},{width:.1f},{height:.1f}), "
-                    f"conf={conf:.2f}"
-                )
+        Args:
+            result: Ultralytics result for a single image
+            letterbox: (scale, pad_x, pad_y) from PinnedInputBuffer.load when the
+                model ran on a preprocessed tensor; boxes are mapped back to
+                frame pixels
 
-            return faces
+        Returns:
+            Tuple of ((N, 4) x, y, width, height boxes, (N,) confidences)
+        """
+        # Read boxes straight from the Ultralytics result (no intermediate container)
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            logger.debug("No faces detected")
+            return _no_boxes()
+
+        # Filter by confidence threshold
+        conf = boxes.conf.cpu().numpy().astype(np.float32, copy=False)
+        keep = conf >= self.confidence_threshold
+        if not np.any(keep):
+            logger.debug("No faces above confidence threshold %s", self.confidence_threshold)
+            return _no_boxes()
+
+        xyxy = boxes.xyxy.cpu().numpy()[keep]
+        if letterbox is not None:
+            scale, pad_x, pad_y = letterbox
+            xyxy = (xyxy - (pad_x, pad_y, pad_x, pad_y)) / scale
+
+        # Convert to (x, y, width, height) for all faces at once
+        xywh = np.empty((len(xyxy), 4), dtype=np.float32)
+        xywh[:, :2] = xyxy[:, :2]
+        xywh[:, 2:] = xyxy[:, 2:] - xyxy[:, :2]
+        return xywh, conf[keep]
+
+    def faces_from_boxes(
+        self, boxes: NDArray[np.float32], confidences: NDArray[np.float32]
+    ) -> list[Face]:
+        """Build Face records (with new face IDs) from detect_boxes() output.
 
-        except Exception as e:
-            logger.error(f"Face detection error: {e}")
-            return []
+        Args:
+            boxes: (N, 4) x, y, width, height boxes in frame pixels
+            confidences: (N,) detection confidences
 
+        Returns:
+            One Face per box, all stamped with the same time
+        """
+        faces: list[Face] = []
+        if len(boxes) == 0:
+            return faces
+        now = datetime.now()
+
+        # Reserve this call's block of IDs at once, so concurrent callers
+        # never hand out the same ID
+        with self._id_lock:
+            face_id = self.next_face_id
+            self.next_face_id += len(boxes)
+
+        for (x, y, width, height), confidence in zip(boxes.tolist(), confidences.tolist()):
+            face = Face(
+                face_id=face_id,
+                x=x,
+                y=y,
+                width=width,
+                height=height,
+                confidence=confidence,
+                timestamp=now,
+            )
+            faces.append(face)
+            face_id += 1
+
+            logger.debug(
+                "Face %d: bbox=(%.1f,%.1f,%.1f,%.1f), conf=%.2f",
+                face.face_id, x, y, width, height, confidence,
+            )
+
+        return faces
+
+
+@dataclass(frozen=True)
+class DetectionResult:
+    """Faces detected in one frame by a DetectionWorker.
+    
+    Attributes:
+        frame_id: Submission order of the frame (increasing)
+        faces: Detected faces
+        frame_width: Frame width in pixels
+        frame_height: Frame height in pixels
+        processing_time: Detection time in seconds
+        boxes: (N, 4) float32 x, y, width, height boxes behind faces
+        confidences: (N,) float32 confidences behind faces
+    """
+    frame_id: int
+    faces: list[Face]
+    frame_width: int
+    frame_height: int
+    processing_time: float
+    boxes: NDArray[np.float32]
+    confidences: NDArray[np.float32]
 
-# Module-level singletons for face detection and tracking
-_face_detector: Optional[FaceDetectionNode] = None
-_face_tracker: Optional[FaceTracker] = None
 
+class DetectionWorker:
+    """Run face detection on a background thread, latest frame wins.
+    
+    submit() hands over a frame without waiting for inference, and
+    pop_result() returns the newest finished detection (once). If frames
+    arrive faster than the model runs, unprocessed frames are replaced by
+    newer ones, so results never lag by more than one inference.
+    
+    A thread rather than a process: torch and ONNX Runtime release the GIL
+    during inference, and the shared camera frames are read-only, so they
+    are handed over without pickling or copying.
+    """
 
+    def __init__(self, detector: FaceDetectionNode):
+        """Initialize the worker (call start() to begin detecting).
+        
+        Args:
+            detector: Face detector to run on submitted frames
+        """
+        self.detector = detector
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._pending: Optional[tuple[int, NDArray[np.uint8]]] = None
+        self._result: Optional[DetectionResult] = None
+        self._next_frame_id = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the detection thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        logger.info("Detection worker started")
+
+    def stop(self) -> None:
+        """Stop the detection thread."""
+        self._stop_event.set()
+        self._frame_ready.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        logger.info("Detection worker stopped")
+
+    def submit(self, frame: NDArray[np.uint8]) -> int:
+        """Queue a frame for detection, replacing any frame not yet started.
+        
+        Args:
+            frame: BGR image; must not be modified afterwards
+            
+        Returns:
+            Frame ID tagged onto the matching DetectionResult
+        """
+        with self._lock:
+            frame_id = self._next_frame_id
+            self._next_frame_id += 1
+            self._pending = (frame_id, frame)
+        self._frame_ready.set()
+        return frame_id
+
+    def pop_result(self) -> Optional[DetectionResult]:
+        """Return the newest detection result, or None if nothing new finished."""
+        with self._lock:
+            result, self._result = self._result, None
+        return result
+
+    def _run(self) -> None:
+        """Detection loop - runs in the worker thread."""
+        while not self._stop_event.is_set():
+            self._frame_ready.wait()
+            with self._lock:
+                pending, self._pending = self._pending, None
+                self._frame_ready.clear()
+            if pending is None:
+                continue
+            
+            frame_id, frame = pending
+            start_time = time.perf_counter()
+            try:
+                boxes, confidences = self.detector.detect_boxes(frame)
+                faces = self.detector.faces_from_boxes(boxes, confidences)
+            except Exception as e:
+                logger.error(f"Detection worker failed on frame {frame_id}: {e}")
+                continue
+            frame_height, frame_width = frame.shape[:2]
+            result = DetectionResult(
+                frame_id=frame_id,
+                faces=faces,
+                frame_width=frame_width,
+                frame_height=frame_height,
+                processing_time=time.perf_counter() - start_time,
+                boxes=boxes,
+                confidences=confidences,
+            )
+            with self._lock:
+                # Frames are detected in submission order; keep the newest
+                if self._result is None or self._result.frame_id < frame_id:
+                    self._result = result
+
+
+# Module-level singletons for face detection and tracking. functools.cache
+# makes every call after the first a plain cache hit (no global lookup and
+# None check); use .cache_clear() to rebuild one.
+
+
+@functools.cache
 def get_face_detector() -> FaceDetectionNode:
     """Get or create singleton face detector."""
-    global _face_detector
-    if _face_detector is None:
-        # Higher confidence threshold for more stable detections
-        _face_detector = FaceDetectionNode(confidence_threshold=0.5)
-    return _face_detector
+    # Higher confidence threshold for more stable detections
+    return FaceDetectionNode(
+        confidence_threshold=0.5,
+        backend=os.environ.get("RANGER_DETECTOR_BACKEND", "torch"),
+        motion_threshold=float(os.environ.get("RANGER_MOTION_THRESHOLD", "0")),
+    )
 
 
+@functools.cache
 def get_face_tracker() -> FaceTracker:
     """Get or create singleton face tracker."""
-    global _face_tracker
-    if _face_tracker is None:
-        _face_tracker = FaceTracker(max_distance=100.0, track_timeout=2.0)
-    return _face_tracker
+    return FaceTracker(max_distance=100.0, track_timeout=2.0)
 
 
-def vision_node(state: BrainState, reachy_mini=None) -> BrainState:
+@functools.cache
+def get_detection_worker() -> Optional[DetectionWorker]:
+    """Get or create the singleton background detection worker.
+    
+    Only enabled with RANGER_ASYNC_DETECTION=1 (read on first call); returns
+    None otherwise, and vision_node then detects synchronously.
+    """
+    if os.environ.get("RANGER_ASYNC_DETECTION") != "1":
+        return None
+    worker = DetectionWorker(get_face_detector())
+    worker.start()
+    return worker
+
+
+def vision_node(
+    state: BrainState,
+    reachy_mini=None,
+    frame_source: Optional[Callable[[], Optional[NDArray[np.uint8]]]] = None,
+) -> BrainState:
     """Vision perception node - processes camera frames for face detection.
     
     Integrates with ReachyMini SDK to capture camera frames, detect faces with YOLO,
     track faces across frames, and estimate 3D positions.
     
+    When frame_source is given (e.g. CameraWorker.get_latest_frame), frames are
+    read from it instead of the SDK, so the app has a single camera consumer and
+    perception shares its frame without another capture or copy.
+    
+    When the background detection worker is enabled (RANGER_ASYNC_DETECTION=1),
+    the frame is submitted to it and the newest finished detection is tracked
+    instead; until one is available the previous vision data is kept.
+    
     Args:
         state: Current brain state
         reachy_mini: ReachyMini instance (optional, for camera access)
+        frame_source: Callable returning the latest shared frame (optional)
     
     Returns:
         Updated brain state with detected faces and tracked humans
     """
-    updated = state.model_copy(deep=True)
-    
     # If no camera provided, return empty data (for testing without hardware)
-    if reachy_mini is None:
-        updated.sensors.vision.faces = []
-        updated.sensors.vision.frame_timestamp = datetime.now()
-        updated.sensors.vision.fps = 0.0
-        updated.world_model.humans = []
-        updated = add_log(updated, "Vision: no camera provided (test mode)")
-        updated = update_timestamp(updated)
-        return updated
+    if reachy_mini is None and frame_source is None:
+        return _with_vision(state, "Perception: no camera provided (test mode)")
     
     # Check if camera is initialized
-    if reachy_mini.media.camera is None:
-        updated.sensors.vision.faces = []
-        updated.sensors.vision.frame_timestamp = datetime.now()
-        updated.sensors.vision.fps = 0.0
-        updated.world_model.humans = []
-        updated = add_log(updated, "Vision: camera not initialized")
-        updated = update_timestamp(updated)
-        return updated
-    
-    # Get frame from camera via SDK
-    frame = reachy_mini.media.get_frame()
+    if frame_source is None and reachy_mini.media.camera is None:
+        return _with_vision(state, "Perception: camera not initialized")
+    
+    # Get frame from the shared source if available, otherwise from camera via SDK
+    if frame_source is not None:
+        frame = frame_source()
+    else:
+        frame = reachy_mini.media.get_frame()
     
     if frame is None:
-        updated.sensors.vision.faces = []
-        updated.sensors.vision.frame_timestamp = datetime.now()
-        updated.sensors.vision.fps = 0.0
-        updated.world_model.humans = []
-        updated = add_log(updated, "Vision: failed to capture frame")
-        updated = update_timestamp(updated)
-        return updated
+        return _with_vision(state, "Perception: failed to capture frame")
     
     # Get frame dimensions
     frame_height, frame_width = frame.shape[:2]
@@ -244,33 +656,79 @@ def vision_node(state: BrainState, reachy_mini=None) -> BrainState:
         logger.info(f"Camera frame size: {frame_width}x{frame_height}")
     vision_node._frame_count += 1
     
-    # Process frame with face detection and tracking
-    start_time = time.time()
-    detected_faces, tracked_humans, primary_id = process_camera_frame(
-        frame, frame_width, frame_height
-    )
-    processing_time = time.time() - start_time
+    # With a detection worker, hand the frame over and track the newest
+    # finished detection; keep the previous vision/tracking until one lands
+    worker = get_detection_worker()
+    if worker is not None:
+        worker.submit(frame)
+        result = worker.pop_result()
+        if result is None:
+            now = datetime.now()
+            return add_log(update_timestamp(state, now), "Perception: detection pending", now)
+        detected_faces = result.faces
+        tracked_humans, primary_id = _track_faces(
+            detected_faces, result.frame_width, result.frame_height, result.boxes
+        )
+        processing_time = result.processing_time
+    else:
+        # Process frame with face detection and tracking
+        start_time = time.perf_counter()
+        detected_faces, tracked_humans, primary_id = process_camera_frame(
+            frame, frame_width, frame_height
+        )
+        processing_time = time.perf_counter() - start_time
     
     # Calculate FPS (1 / processing time)
     fps = 1.0 / processing_time if processing_time > 0 else 0.0
     
-    # Update state
-    updated.sensors.vision.faces = detected_faces
-    updated.sensors.vision.frame_timestamp = datetime.now()
-    updated.sensors.vision.fps = fps
-    updated.world_model.humans = tracked_humans
-    
     # Log result
     num_faces = len(detected_faces)
     num_humans = len(tracked_humans)
     primary_str = f", primary={primary_id}" if primary_id is not None else ""
-    updated = add_log(
-        updated, 
-        f"Vision: {num_faces} face(s), {num_humans} human(s){primary_str}, {fps:.1f} FPS"
+    return _with_vision(
+        state,
+        f"Perception: {num_faces} face(s), {num_humans} human(s){primary_str}, {fps:.1f} FPS",
+        faces=detected_faces,
+        humans=tracked_humans,
+        fps=fps,
     )
-    updated = update_timestamp(updated)
+
+
+def _with_vision(
+    state: BrainState,
+    message: str,
+    faces: Optional[list[Face]] = None,
+    humans: Optional[list[Human]] = None,
+    fps: float = 0.0,
+) -> BrainState:
+    """Return a copy of state with new vision results, log entry and timestamp.
     
-    return updated
+    Only the sections on the path to a changed field (sensors.vision,
+    world_model, metadata) are copied, and shallowly, so the cost does not
+    grow with the rest of the state. With no faces/humans given, vision and
+    tracking are cleared (no camera or no frame).
+    """
+    # One timestamp for the frame, log entry and metadata
+    now = datetime.now()
+    
+    vision = state.sensors.vision.model_copy(update={
+        "faces": faces or [],
+        "frame_timestamp": now,
+        "fps": fps,
+    })
+    world_model = state.world_model.model_copy(update={
+        "humans": humans or [],
+    })
+    # deque.copy() keeps maxlen, so only the last MAX_LOGS entries are kept
+    logs = state.metadata.logs.copy()
+    logs.append(f"{now.isoformat()}: {message}")
+    metadata = state.metadata.model_copy(update={"logs": logs, "timestamp": now})
+    
+    return state.model_copy(update={
+        "sensors": state.sensors.model_copy(update={"vision": vision}),
+        "world_model": world_model,
+        "metadata": metadata,
+    })
 
 
 def process_camera_frame(
@@ -291,24 +749,41 @@ def process_camera_frame(
         Tuple of (detected_faces, tracked_humans, primary_face_id)
     """
     detector = get_face_detector()
-    tracker = get_face_tracker()
     
-    # Detect faces
-    detected_faces = detector.detect_faces(frame)
+    # Detect faces; the tracker consumes the box array directly
+    boxes, confidences = detector.detect_boxes(frame)
+    detected_faces = detector.faces_from_boxes(boxes, confidences)
+    
+    humans, primary_id = _track_faces(detected_faces, frame_width, frame_height, boxes)
+    return detected_faces, humans, primary_id
+
+
+def _track_faces(
+    detected_faces: list[Face],
+    frame_width: int,
+    frame_height: int,
+    boxes: Optional[NDArray[np.float32]] = None,
+) -> tuple[list[Human], Optional[int]]:
+    """Update the shared tracker and convert tracks to Human objects."""
+    tracker = get_face_tracker()
     
     # Update tracker with detections
-    tracked_faces = tracker.update(detected_faces)
+    tracked_faces = tracker.update(detected_faces, boxes=boxes)
+    if not tracked_faces:
+        return [], None
     
-    # Convert tracked faces to Human objects with 3D positions
+    # Convert tracked faces to Human objects with 3D positions (one
+    # vectorized estimate for all tracks, rows in track order)
+    positions = tracker.estimate_3d_positions_batch(frame_width, frame_height)
     humans: list[Human] = []
-    for track in tracked_faces:
-        position_3d = tracker.estimate_3d_position(track, frame_width, frame_height)
+    for track, (x, y, z) in zip(tracked_faces, positions.tolist()):
+        position_3d = Position3D(x=x, y=y, z=z)
         human = Human(
             human_id=track.persistent_id,
             persistent_id=track.persistent_id,
             position=position_3d,
             face_id=track.face.face_id,
-            last_seen=datetime.fromtimestamp(track.last_seen),
+            last_seen=track.face.timestamp,  # Wall time of the last matched detection
             tracking_confidence=track.tracking_confidence,
             is_primary=False,  # Will be set below
         )
@@ -324,4 +799,4 @@ def process_camera_frame(
                 human.is_primary = True
                 break
     
-    return detected_faces, humans, primary_id
+    return humans, primary_id
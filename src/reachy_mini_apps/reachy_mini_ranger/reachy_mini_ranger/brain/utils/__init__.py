@@ -2,6 +2,7 @@
 
 Shared utilities used across multiple nodes:
 - kinematics.py: Head orientation calculations, IK helpers
+- jit.py: Optional Numba JIT decorator (no-op fallback)
 - emotion_modulation.py: Emotion-based behavior modification
 """
 
@@ -10,7 +11,15 @@ from reachy_mini_ranger.brain.utils.kinematics import (
     apply_safety_limits,
     smooth_transition,
     calculate_look_at_with_safety,
+    clamp_head,
     ease_in_out_cubic,
+    quat_slerp,
+    quat_to_xyz_euler,
+    rotmat_to_xyz_euler,
+    xyz_euler_to_quat,
+    xyz_euler_to_rotmat,
+    compose_head_pose,
+    warmup,
 )
 
 __all__ = [
@@ -18,5 +27,13 @@ __all__ = [
     "apply_safety_limits",
     "smooth_transition",
     "calculate_look_at_with_safety",
+    "clamp_head",
     "ease_in_out_cubic",
+    "quat_slerp",
+    "quat_to_xyz_euler",
+    "rotmat_to_xyz_euler",
+    "xyz_euler_to_quat",
+    "xyz_euler_to_rotmat",
+    "compose_head_pose",
+    "warmup",
 ]
@@ -0,0 +1,28 @@
+"""Optional Numba JIT support for hot numeric helpers.
+
+Numba is an optional dependency (``pip install reachy_mini_ranger[accel]``).
+When it is not installed, ``njit`` is a no-op decorator and decorated
+functions run as plain Python with identical results.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["njit", "NUMBA_AVAILABLE"]
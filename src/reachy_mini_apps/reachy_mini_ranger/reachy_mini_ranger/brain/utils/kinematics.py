@@ -23,6 +23,8 @@ from typing import Tuple
 
 import numpy as np
 
+from reachy_mini_ranger.brain.utils.jit import njit
+
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,38 @@ HEAD_PITCH_LIMIT = 40.0  # degrees, ±40°
 HEAD_ROLL_LIMIT = 40.0  # degrees, ±40°
 BODY_HEAD_YAW_DIFF_LIMIT = 65.0  # degrees, ±65° relative to body
 
+# Violation bits returned by clamp_head()
+CLAMP_YAW_LOW = 1
+CLAMP_YAW_HIGH = 2
+CLAMP_PITCH_LOW = 4
+CLAMP_PITCH_HIGH = 8
+CLAMP_ROLL_LOW = 16
+CLAMP_ROLL_HIGH = 32
+
+# 180/pi, so the kernels multiply instead of calling math.degrees()
+_RAD2DEG = 57.29577951308232
+
+# Integer easing codes understood by the fused look-at kernel
+EASING_LINEAR = 0
+EASING_CUBIC = 1
+_EASING_CODES = {"linear": EASING_LINEAR, "cubic": EASING_CUBIC}
+
+
+@njit(cache=True)
+def _look_at_core(tx: float, ty: float, tz: float) -> Tuple[float, float, float]:
+    """Scalar look-at kernel behind calculate_look_at_angles() (JIT when available)."""
+    yaw = math.atan2(ty, tx) * _RAD2DEG
+    # Reachy Mini convention: negative pitch = look up
+    horizontal_distance = math.sqrt(tx * tx + ty * ty)
+    if horizontal_distance > 0.001:  # Avoid division by zero
+        pitch = -math.atan2(tz, horizontal_distance) * _RAD2DEG
+    elif tz > 0:
+        # Target directly above/below
+        pitch = -90.0
+    else:
+        pitch = 90.0
+    return yaw, pitch, 0.0
+
 
 def calculate_look_at_angles(
     target_x: float,
@@ -61,29 +95,15 @@ def calculate_look_at_angles(
         >>> print(f"Yaw: {yaw:.1f}°, Pitch: {pitch:.1f}°")
         Yaw: 26.6°, Pitch: 0.0°
     """
-    # Calculate yaw (rotation around Z axis)
-    # atan2(y, x) gives angle from forward axis
-    yaw = math.degrees(math.atan2(target_y, target_x))
-    
-    # Calculate pitch (rotation around Y axis)
-    # atan2(z, horizontal_distance)
-    # Note: Reachy Mini convention is negative pitch = look up
-    horizontal_distance = math.sqrt(target_x**2 + target_y**2)
-    if horizontal_distance > 0.001:  # Avoid division by zero
-        pitch = -math.degrees(math.atan2(target_z, horizontal_distance))  # Inverted for Reachy convention
-    else:
-        # Target directly above/below
-        pitch = -90.0 if target_z > 0 else 90.0
-    
-    # Roll calculation (optional, for natural head tilt)
-    # For now, keep roll at 0 (no tilt)
-    # Future: could add slight roll when looking far to sides
-    roll = 0.0
+    # Roll stays at 0 (no tilt); a slight roll when looking far to the
+    # sides could be added in the kernel later
+    yaw, pitch, roll = _look_at_core(target_x, target_y, target_z)
     
-    logger.debug(
-        f"Look at ({target_x:.2f}, {target_y:.2f}, {target_z:.2f}) -> "
-        f"yaw={yaw:.1f}°, pitch={pitch:.1f}°, roll={roll:.1f}°"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Look at (%.2f, %.2f, %.2f) -> yaw=%.1f°, pitch=%.1f°, roll=%.1f°",
+            target_x, target_y, target_z, yaw, pitch, roll,
+        )
     
     return yaw, pitch, roll
 
@@ -115,68 +135,86 @@ def apply_safety_limits(
         - Pitch: ±40°
         - Roll: ±40°
     """
-    clamped_yaw = yaw
-    clamped_pitch = pitch
-    clamped_roll = roll
-    clamped = False
-    
-    # Clamp pitch
-    if pitch > HEAD_PITCH_LIMIT:
-        clamped_pitch = HEAD_PITCH_LIMIT
-        clamped = True
-        if warn_on_clamp:
-            logger.warning(f"Pitch clamped: {pitch:.1f}° -> {clamped_pitch:.1f}°")
-    elif pitch < -HEAD_PITCH_LIMIT:
-        clamped_pitch = -HEAD_PITCH_LIMIT
-        clamped = True
-        if warn_on_clamp:
-            logger.warning(f"Pitch clamped: {pitch:.1f}° -> {clamped_pitch:.1f}°")
-    
-    # Clamp roll
-    if roll > HEAD_ROLL_LIMIT:
-        clamped_roll = HEAD_ROLL_LIMIT
-        clamped = True
-        if warn_on_clamp:
-            logger.warning(f"Roll clamped: {roll:.1f}° -> {clamped_roll:.1f}°")
-    elif roll < -HEAD_ROLL_LIMIT:
-        clamped_roll = -HEAD_ROLL_LIMIT
-        clamped = True
-        if warn_on_clamp:
-            logger.warning(f"Roll clamped: {roll:.1f}° -> {clamped_roll:.1f}°")
+    # min/max chains instead of per-axis if/elif ladders; the absolute yaw
+    # limit is applied first, then the body-relative window
+    clamped_pitch = min(HEAD_PITCH_LIMIT, max(-HEAD_PITCH_LIMIT, pitch))
+    clamped_roll = min(HEAD_ROLL_LIMIT, max(-HEAD_ROLL_LIMIT, roll))
+    clamped_yaw = min(HEAD_YAW_LIMIT, max(-HEAD_YAW_LIMIT, yaw))
+    clamped_yaw = min(
+        body_yaw + BODY_HEAD_YAW_DIFF_LIMIT,
+        max(body_yaw - BODY_HEAD_YAW_DIFF_LIMIT, clamped_yaw),
+    )
     
-    # Clamp yaw (absolute)
-    if yaw > HEAD_YAW_LIMIT:
-        clamped_yaw = HEAD_YAW_LIMIT
-        clamped = True
-        if warn_on_clamp:
-            logger.warning(f"Yaw clamped: {yaw:.1f}° -> {clamped_yaw:.1f}°")
-    elif yaw < -HEAD_YAW_LIMIT:
-        clamped_yaw = -HEAD_YAW_LIMIT
-        clamped = True
-        if warn_on_clamp:
-            logger.warning(f"Yaw clamped: {yaw:.1f}° -> {clamped_yaw:.1f}°")
-    
-    # Check body-relative yaw limit
-    yaw_diff = abs(clamped_yaw - body_yaw)
-    if yaw_diff > BODY_HEAD_YAW_DIFF_LIMIT:
-        # Clamp to ±65° relative to body
-        if clamped_yaw > body_yaw:
-            clamped_yaw = body_yaw + BODY_HEAD_YAW_DIFF_LIMIT
-        else:
-            clamped_yaw = body_yaw - BODY_HEAD_YAW_DIFF_LIMIT
-        clamped = True
+    if clamped_yaw != yaw or clamped_pitch != pitch or clamped_roll != roll:
         if warn_on_clamp:
             logger.warning(
-                f"Yaw-body difference clamped: {yaw_diff:.1f}° > {BODY_HEAD_YAW_DIFF_LIMIT}°, "
-                f"yaw adjusted to {clamped_yaw:.1f}°"
+                "Head angles clamped: (%.1f°, %.1f°, %.1f°) -> (%.1f°, %.1f°, %.1f°) "
+                "(body_yaw=%.1f°)",
+                yaw, pitch, roll, clamped_yaw, clamped_pitch, clamped_roll, body_yaw,
             )
-    
-    if not clamped:
+    else:
         logger.debug("All angles within safety limits")
     
     return clamped_yaw, clamped_pitch, clamped_roll
 
 
+@njit(cache=True)
+def clamp_head(yaw: float, pitch: float, roll: float) -> Tuple[float, float, float, int]:
+    """Clamp head angles to absolute limits and report which limits were hit.
+    
+    JIT-compiled when Numba is available. Unlike apply_safety_limits(), this
+    does no logging and no body-relative check, so it can run as a tight
+    scalar kernel; callers decode the mask only when it is non-zero.
+    
+    Args:
+        yaw: Desired yaw angle in degrees
+        pitch: Desired pitch angle in degrees
+        roll: Desired roll angle in degrees
+        
+    Returns:
+        Tuple of (yaw, pitch, roll, violations) where violations is a bitmask
+        of CLAMP_* flags (0 when all angles were within limits)
+    """
+    violations = 0
+    if yaw < -HEAD_YAW_LIMIT:
+        yaw = -HEAD_YAW_LIMIT
+        violations |= CLAMP_YAW_LOW
+    elif yaw > HEAD_YAW_LIMIT:
+        yaw = HEAD_YAW_LIMIT
+        violations |= CLAMP_YAW_HIGH
+    if pitch < -HEAD_PITCH_LIMIT:
+        pitch = -HEAD_PITCH_LIMIT
+        violations |= CLAMP_PITCH_LOW
+    elif pitch > HEAD_PITCH_LIMIT:
+        pitch = HEAD_PITCH_LIMIT
+        violations |= CLAMP_PITCH_HIGH
+    if roll < -HEAD_ROLL_LIMIT:
+        roll = -HEAD_ROLL_LIMIT
+        violations |= CLAMP_ROLL_LOW
+    elif roll > HEAD_ROLL_LIMIT:
+        roll = HEAD_ROLL_LIMIT
+        violations |= CLAMP_ROLL_HIGH
+    return yaw, pitch, roll, violations
+
+
+def _wrap180(angle: float) -> float:
+    """Wrap an angle in degrees to [-180, 180] in constant time.
+    
+    Angles already in range, both limits included, are returned unchanged
+    and others are reduced by whole turns toward the nearest limit, so
+    +180 stays +180 (same result as repeated +/-360 steps).
+    """
+    if angle > 180.0:
+        return angle - 360.0 * math.ceil((angle - 180.0) / 360.0)
+    if angle < -180.0:
+        return angle + 360.0 * math.ceil((-180.0 - angle) / 360.0)
+    return angle
+
+
+# Same reduction for compiled kernels
+_wrap180_jit = njit(cache=True)(_wrap180)
+
+
 def ease_in_out_cubic(t: float) -> float:
     """Cubic ease-in-out interpolation function.
     
@@ -191,10 +229,11 @@ def ease_in_out_cubic(t: float) -> float:
     Reference:
         https://easings.net/#easeInOutCubic
     """
+    # Plain multiplies; pow() goes through the generic number protocol
     if t < 0.5:
-        return 4 * t * t * t
-    else:
-        return 1 - pow(-2 * t + 2, 3) / 2
+        return 4.0 * t * t * t
+    u = 2.0 - 2.0 * t
+    return 1.0 - u * u * u * 0.5
 
 
 def smooth_transition(
@@ -223,8 +262,8 @@ def smooth_transition(
         >>> print(f"Angle: {angle:.1f}°")
         Angle: 22.5°
     """
-    # Clamp progress
-    progress = np.clip(progress, 0.0, 1.0)
+    # Clamp progress (plain floats; np.clip on a scalar costs a ufunc dispatch)
+    progress = max(0.0, min(1.0, progress))
     
     # Apply easing function
     if easing == "cubic":
@@ -239,21 +278,13 @@ def smooth_transition(
     angle_diff = target_angle - current_angle
     
     # Normalize to [-180, 180]
-    while angle_diff > 180:
-        angle_diff -= 360
-    while angle_diff < -180:
-        angle_diff += 360
+    angle_diff = _wrap180(angle_diff)
     
     # Interpolate
     interpolated = current_angle + angle_diff * eased_progress
     
     # Normalize result to [-180, 180]
-    while interpolated > 180:
-        interpolated -= 360
-    while interpolated < -180:
-        interpolated += 360
-    
-    return interpolated
+    return _wrap180(interpolated)
 
 
 def calculate_look_at_with_safety(
@@ -285,22 +316,263 @@ def calculate_look_at_with_safety(
     Returns:
         Tuple of (yaw, pitch, roll) in degrees with safety and smoothing applied
     """
-    # Calculate target angles
-    target_yaw, target_pitch, target_roll = calculate_look_at_angles(
-        target_x, target_y, target_z, current_yaw
+    easing_code = _EASING_CODES.get(easing)
+    if easing_code is None:
+        logger.warning(f"Unknown easing '{easing}', using linear")
+        easing_code = EASING_LINEAR
+    
+    yaw, pitch, roll, clamped = _look_at_with_safety(
+        target_x, target_y, target_z,
+        current_yaw, current_pitch, current_roll,
+        body_yaw, progress, easing_code,
     )
+    if clamped:
+        logger.warning(
+            "Look-at target (%.2f, %.2f, %.2f) clamped to safety limits (body_yaw=%.1f°)",
+            target_x, target_y, target_z, body_yaw,
+        )
+    
+    return yaw, pitch, roll
+
+
+@njit(cache=True)
+def _look_at_with_safety(
+    tx: float,
+    ty: float,
+    tz: float,
+    current_yaw: float,
+    current_pitch: float,
+    current_roll: float,
+    body_yaw: float,
+    progress: float,
+    easing_code: int,
+) -> Tuple[float, float, float, bool]:
+    """Fused look-at, safety clamp and eased transition (JIT when available).
+    
+    Same math as calculate_look_at_angles() -> apply_safety_limits() ->
+    smooth_transition() in a single call, with the angle wrapping done by
+    _wrap180() reduction instead of while loops. Logging is left to the
+    caller via the returned clamped flag.
     
-    # Apply safety limits to target
-    target_yaw, target_pitch, target_roll = apply_safety_limits(
-        target_yaw, target_pitch, target_roll, body_yaw, warn_on_clamp=True
+    Returns:
+        Tuple of (yaw, pitch, roll, clamped) with angles in degrees
+    """
+    target_yaw, target_pitch, target_roll = _look_at_core(tx, ty, tz)
+    
+    pitch = min(HEAD_PITCH_LIMIT, max(-HEAD_PITCH_LIMIT, target_pitch))
+    roll = min(HEAD_ROLL_LIMIT, max(-HEAD_ROLL_LIMIT, target_roll))
+    yaw = min(HEAD_YAW_LIMIT, max(-HEAD_YAW_LIMIT, target_yaw))
+    yaw = min(
+        body_yaw + BODY_HEAD_YAW_DIFF_LIMIT,
+        max(body_yaw - BODY_HEAD_YAW_DIFF_LIMIT, yaw),
     )
+    clamped = yaw != target_yaw or pitch != target_pitch or roll != target_roll
+    if progress >= 1.0:
+        return yaw, pitch, roll, clamped
     
-    # Smooth transition
-    if progress < 1.0:
-        yaw = smooth_transition(current_yaw, target_yaw, progress, easing)
-        pitch = smooth_transition(current_pitch, target_pitch, progress, easing)
-        roll = smooth_transition(current_roll, target_roll, progress, easing)
+    t = max(0.0, min(1.0, progress))
+    if easing_code == EASING_CUBIC:
+        if t < 0.5:
+            t = 4.0 * t * t * t
+        else:
+            u = -2.0 * t + 2.0
+            t = 1.0 - u * u * u / 2.0
+    
+    # Shortest-path interpolation, wrapped to [-180, 180]
+    yaw = _wrap180_jit(current_yaw + _wrap180_jit(yaw - current_yaw) * t)
+    pitch = _wrap180_jit(current_pitch + _wrap180_jit(pitch - current_pitch) * t)
+    roll = _wrap180_jit(current_roll + _wrap180_jit(roll - current_roll) * t)
+    return yaw, pitch, roll, clamped
+
+
+# ============================================================================
+# Rotation helpers
+# ============================================================================
+#
+# Closed-form replacements for the few scipy Rotation conversions used on
+# per-tick paths. Conventions follow scipy: quaternions are scalar-last
+# (x, y, z, w) and euler angles are extrinsic "xyz" (roll, pitch, yaw) in
+# radians, i.e. R = Rz(yaw) @ Ry(pitch) @ Rx(roll).
+
+
+@njit(cache=True)
+def quat_slerp(q0: np.ndarray, q1: np.ndarray, t: float) -> np.ndarray:
+    """Spherical linear interpolation between two unit quaternions.
+    
+    Takes the shortest arc and falls back to normalised lerp when the
+    quaternions are nearly parallel.
+    
+    Args:
+        q0: Start quaternion (x, y, z, w)
+        q1: End quaternion (x, y, z, w)
+        t: Progress from 0.0 (q0) to 1.0 (q1)
+        
+    Returns:
+        Interpolated unit quaternion (x, y, z, w)
+    """
+    dot = q0[0] * q1[0] + q0[1] * q1[1] + q0[2] * q1[2] + q0[3] * q1[3]
+    sign = 1.0
+    if dot < 0.0:
+        sign = -1.0
+        dot = -dot
+    if dot > 0.9995:
+        w0 = 1.0 - t
+        w1 = t
     else:
-        yaw, pitch, roll = target_yaw, target_pitch, target_roll
+        theta = math.acos(dot)
+        sin_theta = math.sin(theta)
+        w0 = math.sin((1.0 - t) * theta) / sin_theta
+        w1 = math.sin(t * theta) / sin_theta
+    q = w0 * q0 + (sign * w1) * q1
+    return q / math.sqrt(q[0] * q[0] + q[1] * q[1] + q[2] * q[2] + q[3] * q[3])
+
+
+@njit(cache=True)
+def quat_to_xyz_euler(q: np.ndarray) -> Tuple[float, float, float]:
+    """Convert a unit quaternion (x, y, z, w) to extrinsic xyz euler angles.
     
-    return yaw, pitch, roll
+    Returns:
+        Tuple of (roll, pitch, yaw) in radians, matching scipy's
+        Rotation.as_euler("xyz") away from gimbal lock (pitch = ±90°)
+    """
+    x, y, z, w = q[0], q[1], q[2], q[3]
+    roll = math.atan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    pitch = math.asin(min(1.0, max(-1.0, 2.0 * (w * y - z * x))))
+    yaw = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return roll, pitch, yaw
+
+
+@njit(cache=True)
+def rotmat_to_xyz_euler(m: np.ndarray) -> Tuple[float, float, float]:
+    """Convert a rotation matrix to extrinsic xyz euler angles.
+    
+    Args:
+        m: Rotation matrix; only the upper-left 3x3 block is read, so a full
+            4x4 homogeneous pose can be passed directly
+        
+    Returns:
+        Tuple of (roll, pitch, yaw) in radians, matching scipy's
+        Rotation.from_matrix(m).as_euler("xyz") for proper rotations
+    """
+    sy = math.sqrt(m[0, 0] * m[0, 0] + m[1, 0] * m[1, 0])
+    pitch = math.atan2(-m[2, 0], sy)
+    if sy > 1e-6:
+        roll = math.atan2(m[2, 1], m[2, 2])
+        yaw = math.atan2(m[1, 0], m[0, 0])
+    else:
+        # Gimbal lock: yaw and roll share an axis, so put it all in roll
+        roll = math.atan2(-m[1, 2], m[1, 1])
+        yaw = 0.0
+    return roll, pitch, yaw
+
+
+@njit(cache=True)
+def xyz_euler_to_quat(roll: float, pitch: float, yaw: float) -> np.ndarray:
+    """Convert extrinsic xyz euler angles (radians) to a quaternion.
+    
+    Returns:
+        Unit quaternion (x, y, z, w), the same rotation as scipy's
+        Rotation.from_euler("xyz", [roll, pitch, yaw]).as_quat()
+    """
+    cr, sr = math.cos(0.5 * roll), math.sin(0.5 * roll)
+    cp, sp = math.cos(0.5 * pitch), math.sin(0.5 * pitch)
+    cy, sy = math.cos(0.5 * yaw), math.sin(0.5 * yaw)
+    q = np.empty(4)
+    q[0] = sr * cp * cy - cr * sp * sy
+    q[1] = cr * sp * cy + sr * cp * sy
+    q[2] = cr * cp * sy - sr * sp * cy
+    q[3] = cr * cp * cy + sr * sp * sy
+    return q
+
+
+@njit(cache=True)
+def xyz_euler_to_rotmat(roll: float, pitch: float, yaw: float) -> np.ndarray:
+    """Convert extrinsic xyz euler angles (radians) to a rotation matrix.
+    
+    Returns:
+        3x3 matrix equal to scipy's
+        Rotation.from_euler("xyz", [roll, pitch, yaw]).as_matrix()
+    """
+    cr, sr = math.cos(roll), math.sin(roll)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cy, sy = math.cos(yaw), math.sin(yaw)
+    m = np.empty((3, 3))
+    m[0, 0] = cy * cp
+    m[0, 1] = cy * sp * sr - sy * cr
+    m[0, 2] = cy * sp * cr + sy * sr
+    m[1, 0] = sy * cp
+    m[1, 1] = sy * sp * sr + cy * cr
+    m[1, 2] = sy * sp * cr - cy * sr
+    m[2, 0] = -sp
+    m[2, 1] = cp * sr
+    m[2, 2] = cp * cr
+    return m
+
+
+@njit(cache=True)
+def compose_head_pose(
+    x: float,
+    y: float,
+    z: float,
+    roll: float,
+    pitch: float,
+    yaw: float,
+    base: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Apply a world-frame (x, y, z, roll, pitch, yaw) offset to a head pose.
+    
+    Same result as the SDK's compose_world_offset(base, offset) with the
+    offset built from these values: the offset rotation is applied on the
+    left (R_off @ R_base) and the translations add, so the base position is
+    not rotated by the offset. Writes every element of out, allocating
+    nothing; out may be base itself.
+    
+    Args:
+        x, y, z: Offset translation in meters
+        roll, pitch, yaw: Offset rotation as extrinsic xyz euler angles (radians)
+        base: 4x4 homogeneous head pose
+        out: 4x4 array receiving the composed pose
+    """
+    cr, sr = math.cos(roll), math.sin(roll)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cy, sy = math.cos(yaw), math.sin(yaw)
+    r00 = cy * cp
+    r01 = cy * sp * sr - sy * cr
+    r02 = cy * sp * cr + sy * sr
+    r10 = sy * cp
+    r11 = sy * sp * sr + cy * cr
+    r12 = sy * sp * cr - cy * sr
+    r20 = -sp
+    r21 = cp * sr
+    r22 = cp * cr
+    for j in range(3):
+        b0, b1, b2 = base[0, j], base[1, j], base[2, j]
+        out[0, j] = r00 * b0 + r01 * b1 + r02 * b2
+        out[1, j] = r10 * b0 + r11 * b1 + r12 * b2
+        out[2, j] = r20 * b0 + r21 * b1 + r22 * b2
+        out[3, j] = 0.0
+    out[0, 3] = base[0, 3] + x
+    out[1, 3] = base[1, 3] + y
+    out[2, 3] = base[2, 3] + z
+    out[3, 3] = 1.0
+
+
+
+def warmup() -> None:
+    """Compile every JIT kernel in this module ahead of use.
+    
+    With Numba installed, each kernel is otherwise compiled (or loaded from
+    the on-disk cache) on its first call, which would stall the first brain
+    cycle or camera tick. Call this once at startup, before motion begins.
+    Without Numba it just runs each helper once.
+    """
+    _look_at_core(1.0, 0.0, 0.0)
+    clamp_head(0.0, 0.0, 0.0)
+    _look_at_with_safety(1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.5, EASING_CUBIC)
+    identity = np.array([0.0, 0.0, 0.0, 1.0])
+    quat_to_xyz_euler(quat_slerp(identity, identity, 0.5))
+    rotmat_to_xyz_euler(np.eye(4))
+    xyz_euler_to_quat(0.0, 0.0, 0.0)
+    xyz_euler_to_rotmat(0.0, 0.0, 0.0)
+    compose_head_pose(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, np.eye(4), np.empty((4, 4)))
@@ -0,0 +1,101 @@
+"""Brain worker thread for Reachy Mini Ranger.
+
+Runs the LangGraph brain on its own thread so a slow brain cycle never
+delays the 100 Hz control loop that applies face tracking.
+
+Architecture:
+- Runs in separate thread at ~10 Hz
+- Owns the BrainState and feeds it through graph.invoke() each cycle
+- Publishes each resulting state by reference
+- Main loop reads the latest state's actuator commands without blocking
+"""
+
+import time
+import logging
+import threading
+from typing import Optional
+
+from reachy_mini_ranger.brain.models.state import BrainState
+
+logger = logging.getLogger(__name__)
+
+
+class BrainWorker:
+    """Thread-safe brain worker publishing the latest BrainState."""
+
+    def __init__(self, graph, state: BrainState, rate_hz: float = 10.0) -> None:
+        """Initialize brain worker.
+        
+        Args:
+            graph: Compiled brain graph (anything with invoke(state) -> state)
+            state: Initial BrainState
+            rate_hz: Brain cycle rate
+        """
+        self.graph = graph
+        # Latest published state. Graph nodes return new states (model_copy)
+        # instead of mutating their input, so a published state is never
+        # written again and a single reference store, atomic under the GIL,
+        # is all readers need
+        self.state = state
+        self.period = 1.0 / rate_hz
+        self.is_enabled = True
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Brain statistics
+        self.cycles_run = 0
+        self.overruns = 0
+
+    def get_state(self) -> BrainState:
+        """Get the latest brain state (thread-safe, lock-free).
+        
+        Returns:
+            BrainState published by the most recent brain cycle
+        """
+        return self.state
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Pause or resume brain cycles; the last state stays published."""
+        self.is_enabled = enabled
+        logger.info(f"Brain {'enabled' if enabled else 'disabled'}")
+
+    def start(self) -> None:
+        """Start the brain loop in a thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._working_loop, daemon=True)
+        self._thread.start()
+        logger.info("Brain worker started")
+
+    def stop(self) -> None:
+        """Stop the brain loop."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        logger.info("Brain worker stopped")
+
+    def _working_loop(self) -> None:
+        """Main brain loop - runs continuously in separate thread."""
+        logger.info("Brain worker loop started")
+
+        # Fixed cadence paced by monotonic deadline, so cycle time doesn't
+        # stretch the period
+        next_deadline = time.monotonic() + self.period
+
+        while not self._stop_event.is_set():
+            try:
+                if self.is_enabled:
+                    self.state = self.graph.invoke(self.state)
+                    self.cycles_run += 1
+            except Exception as e:
+                logger.error(f"Brain worker error: {e}", exc_info=True)
+
+            now = time.monotonic()
+            if next_deadline > now:
+                time.sleep(next_deadline - now)
+                next_deadline += self.period
+            else:
+                # Overran the slot: restart the cadence instead of bursting to catch up
+                self.overruns += 1
+                next_deadline = now + self.period
+
+        logger.info(f"Brain worker exited after {self.cycles_run} cycles ({self.overruns} overruns)")
@@ -6,11 +6,13 @@ that runs independently of the main brain loop.
 Architecture:
 - Runs in separate thread at ~30 Hz
 - Captures frames continuously
-- Detects faces using YOLO
+- Detects faces using YOLO (inline, or overlapped on a background
+  DetectionWorker with RANGER_ASYNC_DETECTION=1)
 - Calculates head pose offsets using look_at_image()
 - Main loop reads offsets and applies them
 """
 
+import os
 import time
 import logging
 import threading
@@ -18,75 +20,171 @@ from typing import Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.spatial.transform import Rotation as R
 
 from reachy_mini import ReachyMini
-from reachy_mini_ranger.brain.nodes.perception.vision_node import get_face_detector
+from reachy_mini_ranger.brain.nodes.perception.vision_node import (
+    DetectionWorker,
+    get_face_detector,
+)
+from reachy_mini_ranger.brain.utils.kinematics import (
+    quat_slerp,
+    quat_to_xyz_euler,
+    rotmat_to_xyz_euler,
+    xyz_euler_to_quat,
+)
 
 logger = logging.getLogger(__name__)
 
+# Neutral head orientation as a scalar-last (x, y, z, w) quaternion
+NEUTRAL_QUAT = np.array([0.0, 0.0, 0.0, 1.0])
+
 
 class CameraWorker:
     """Thread-safe camera worker with face tracking."""
 
-    def __init__(self, reachy_mini: ReachyMini) -> None:
+    def __init__(self, reachy_mini: ReachyMini, async_detection: Optional[bool] = None) -> None:
         """Initialize camera worker.
         
         Args:
             reachy_mini: ReachyMini instance for camera and head control
+            async_detection: Run face detection on a background DetectionWorker,
+                tracking each frame with the previous frame's result (one frame
+                of latency, but capture and inference overlap). Defaults to
+                RANGER_ASYNC_DETECTION=1
         """
         self.reachy_mini = reachy_mini
         self.face_detector = get_face_detector()
+        if async_detection is None:
+            async_detection = os.environ.get("RANGER_ASYNC_DETECTION") == "1"
+        self._detection_worker: Optional[DetectionWorker] = (
+            DetectionWorker(self.face_detector) if async_detection else None
+        )
 
-        # Thread-safe frame storage
+        # Latest published frame; replaced by a single reference store, which
+        # is atomic under the GIL, so readers need no lock
         self.latest_frame: Optional[NDArray[np.uint8]] = None
-        self.frame_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
         # Face tracking state
         self.is_head_tracking_enabled = True
+        # Set by set_head_tracking_enabled() on an enabled -> disabled switch
+        self._return_to_neutral_requested = threading.Event()
         self.face_tracking_offsets: Tuple[float, float, float, float, float, float] = (
             0.0, 0.0, 0.0,  # x, y, z translation (meters)
             0.0, 0.0, 0.0,  # roll, pitch, yaw rotation (radians)
         )
-        self.face_tracking_lock = threading.Lock()
+        # Smoothing state in the same (x, y, z, roll, pitch, yaw) order; only the
+        # worker thread touches it and publishes snapshots as tuples
+        self._offsets = np.zeros(6, dtype=np.float64)
+        self._pose6 = np.empty(6, dtype=np.float64)  # per-frame measurement buffer
 
         # Face tracking timing (for smooth return to neutral)
         self.last_face_detected_time: Optional[float] = None
         self.interpolation_start_time: Optional[float] = None
-        self.interpolation_start_pose: Optional[NDArray[np.float32]] = None
+        # (translation, rotation quaternion) captured when the return to neutral starts
+        self.interpolation_start_pose: Optional[Tuple[NDArray[np.float64], NDArray[np.float64]]] = None
         self.face_lost_delay = 1.5  # seconds to wait before returning to neutral
         self.interpolation_duration = 2.0  # seconds to interpolate back (slower, smoother)
 
+        # Adaptive detection rate: every frame while searching, every Nth frame
+        # while a face is tracked (the smoothed offsets are held in between)
+        self.tracking_detect_interval = 3
+        self._detect_every = 1
+        self._frames_since_detect = 0
+
+        # Center (pixels) of the face tracked last, for stable face selection
+        self._last_face_center: Optional[NDArray[np.float32]] = None
+
         # Tracking statistics
         self.frames_processed = 0
         self.faces_detected = 0
 
     def get_latest_frame(self) -> Optional[NDArray[np.uint8]]:
-        """Get the latest camera frame (thread-safe)."""
-        with self.frame_lock:
-            if self.latest_frame is None:
-                return None
-            return self.latest_frame.copy()
+        """Get the latest camera frame (thread-safe, zero-copy, lock-free).
+        
+        The worker publishes each frame once and never writes to it again, so
+        the same read-only array is shared by every consumer. Copy it before
+        drawing on it.
+        """
+        return self.latest_frame
 
     def get_face_tracking_offsets(self) -> Tuple[float, float, float, float, float, float]:
-        """Get current face tracking offsets (thread-safe).
+        """Get current face tracking offsets (thread-safe, lock-free).
+        
+        The worker replaces the whole immutable tuple in one attribute store,
+        which is atomic under the GIL, so readers never see a partial update.
         
         Returns:
             Tuple of (x, y, z, roll, pitch, yaw) offsets
         """
-        with self.face_tracking_lock:
-            return self.face_tracking_offsets
+        return self.face_tracking_offsets
+
+    def _publish_offsets(self) -> None:
+        """Publish the smoothing state as the offsets tuple read by consumers."""
+        self.face_tracking_offsets = tuple(self._offsets.tolist())
+
+    def _detect(
+        self, frame: NDArray[np.uint8]
+    ) -> Optional[Tuple[NDArray[np.float32], NDArray[np.float32]]]:
+        """Detect faces in a frame, inline or through the async detection worker.
+        
+        Returns:
+            (boxes, confidences) as from FaceDetectionNode.detect_boxes(). With
+            the async worker these belong to the newest finished earlier frame,
+            and None means no new result has landed yet.
+        """
+        if self._detection_worker is None:
+            return self.face_detector.detect_boxes(frame)
+        self._detection_worker.submit(frame)
+        result = self._detection_worker.pop_result()
+        if result is None:
+            return None
+        return result.boxes, result.confidences
+
+    def _select_face_center(
+        self,
+        boxes: NDArray[np.float32],
+        confidences: NDArray[np.float32],
+    ) -> NDArray[np.float32]:
+        """Pick the face to track from all candidates in one vectorised pass.
+        
+        Scores each box by confidence times stability, where stability decays
+        with the distance from the previously tracked face (1.0 in place, 0.5
+        one box width away), so the head doesn't jump between similar faces.
+        
+        Args:
+            boxes: (N, 4) x, y, width, height boxes in pixels, N >= 1
+            confidences: (N,) detection confidences
+            
+        Returns:
+            (2,) center of the selected face in pixels
+        """
+        centers = boxes[:, :2] + 0.5 * boxes[:, 2:]
+        scores = confidences
+        if self._last_face_center is not None and len(confidences) > 1:
+            offsets = centers - self._last_face_center
+            distances = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+            scores = confidences / (1.0 + distances / np.maximum(boxes[:, 2], 1.0))
+        center = centers[int(np.argmax(scores))]
+        self._last_face_center = center
+        return center
 
     def set_head_tracking_enabled(self, enabled: bool) -> None:
-        """Enable/disable head tracking."""
+        """Enable/disable head tracking.
+        
+        Disabling tracking asks the worker loop to ease back to neutral.
+        """
+        if self.is_head_tracking_enabled and not enabled:
+            self._return_to_neutral_requested.set()
         self.is_head_tracking_enabled = enabled
         logger.info(f"Head tracking {'enabled' if enabled else 'disabled'}")
 
     def start(self) -> None:
         """Start the camera worker loop in a thread."""
         self._stop_event.clear()
+        if self._detection_worker is not None:
+            self._detection_worker.start()
         self._thread = threading.Thread(target=self._working_loop, daemon=True)
         self._thread.start()
         logger.info("Camera worker started")
@@ -96,18 +194,21 @@ class CameraWorker:
         self._stop_event.set()
         if self._thread is not None:
             self._thread.join(timeout=2.0)
+        if self._detection_worker is not None:
+            self._detection_worker.stop()
         logger.info("Camera worker stopped")
 
     def _working_loop(self) -> None:
         """Main camera worker loop - runs continuously in separate thread."""
         logger.info("Camera worker loop started")
         
-        neutral_pose = np.eye(4, dtype=np.float32)  # Neutral pose (identity matrix)
-        previous_tracking_state = self.is_head_tracking_enabled
+        # Fixed ~30 Hz cadence (to feed the 100 Hz control loop), paced by deadline
+        period = 1.0 / 30.0
+        next_deadline = time.monotonic() + period
 
         while not self._stop_event.is_set():
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # Get frame from robot
                 frame = self.reachy_mini.media.get_frame()
@@ -116,36 +217,41 @@ class CameraWorker:
                     time.sleep(0.01)
                     continue
 
-                # Store frame (thread-safe)
-                with self.frame_lock:
-                    self.latest_frame = frame
+                # Publish frame read-only so consumers can share it without copying
+                frame.flags.writeable = False
+                self.latest_frame = frame
 
                 self.frames_processed += 1
 
-                # Check if tracking was just disabled
-                if previous_tracking_state and not self.is_head_tracking_enabled:
-                    # Trigger return to neutral
+                # Tracking was just disabled: trigger return to neutral
+                if self._return_to_neutral_requested.is_set():
+                    self._return_to_neutral_requested.clear()
                     self.last_face_detected_time = current_time
                     self.interpolation_start_time = None
                     self.interpolation_start_pose = None
 
-                previous_tracking_state = self.is_head_tracking_enabled
-
                 # Handle face tracking if enabled
                 if self.is_head_tracking_enabled:
                     h, w = frame.shape[:2]
                     
-                    # Detect faces
-                    detected_faces = self.face_detector.detect_faces(frame)
+                    # Detect faces (skipped on in-between frames while tracking);
+                    # raw box arrays, since no Face records are needed here
+                    face_center = None
+                    self._frames_since_detect += 1
+                    if self._frames_since_detect >= self._detect_every:
+                        self._frames_since_detect = 0
+                        detection = self._detect(frame)
+                        if detection is not None:
+                            boxes, confidences = detection
+                            if len(confidences):
+                                face_center = self._select_face_center(boxes, confidences)
+                            self._detect_every = (
+                                self.tracking_detect_interval if face_center is not None else 1
+                            )
                     
-                    if detected_faces:
-                        # Use the first face (highest confidence)
-                        face = detected_faces[0]
+                    if face_center is not None:
                         self.faces_detected += 1
-                        
-                        # Calculate face center in pixels
-                        face_center_x = face.x + face.width / 2
-                        face_center_y = face.y + face.height / 2
+                        face_center_x, face_center_y = face_center
 
                         # Face detected - immediately switch to tracking
                         self.last_face_detected_time = current_time
@@ -162,24 +268,23 @@ class CameraWorker:
 
                             # Extract translation and rotation from the target pose
                             translation = target_pose[:3, 3]
-                            rotation = R.from_matrix(target_pose[:3, :3]).as_euler("xyz", degrees=False)
+                            rotation = rotmat_to_xyz_euler(target_pose)
 
                             # Apply exponential smoothing to reduce jitter (alpha=0.7 for responsiveness)
+                            # offsets += alpha * (pose - offsets), in place in the
+                            # persistent buffers so no temporaries are allocated
                             alpha = 0.7
-                            with self.face_tracking_lock:
-                                old_offsets = self.face_tracking_offsets
-                                self.face_tracking_offsets = (
-                                    alpha * float(translation[0]) + (1 - alpha) * old_offsets[0],
-                                    alpha * float(translation[1]) + (1 - alpha) * old_offsets[1],
-                                    alpha * float(translation[2]) + (1 - alpha) * old_offsets[2],
-                                    alpha * float(rotation[0]) + (1 - alpha) * old_offsets[3],
-                                    alpha * float(rotation[1]) + (1 - alpha) * old_offsets[4],
-                                    alpha * float(rotation[2]) + (1 - alpha) * old_offsets[5],
-                                )
+                            pose6 = self._pose6
+                            pose6[:3] = translation
+                            pose6[3:] = rotation
+                            pose6 -= self._offsets
+                            pose6 *= alpha
+                            self._offsets += pose6
+                            self._publish_offsets()
 
                         except (AssertionError, RuntimeError) as e:
                             # Pixel out of bounds or camera issue - skip this frame
-                            logger.debug(f"Face tracking calculation failed: {e}")
+                            logger.debug("Face tracking calculation failed: %s", e)
 
                 # Handle smooth interpolation back to neutral when face is lost
                 if self.last_face_detected_time is not None:
@@ -189,42 +294,28 @@ class CameraWorker:
                         # Start interpolation if not already started
                         if self.interpolation_start_time is None:
                             self.interpolation_start_time = current_time
-                            # Capture current pose as start of interpolation
-                            with self.face_tracking_lock:
-                                current_translation = self.face_tracking_offsets[:3]
-                                current_rotation_euler = self.face_tracking_offsets[3:]
-                                # Convert to 4x4 pose matrix
-                                pose_matrix = np.eye(4, dtype=np.float32)
-                                pose_matrix[:3, 3] = current_translation
-                                pose_matrix[:3, :3] = R.from_euler(
-                                    "xyz", current_rotation_euler
-                                ).as_matrix()
-                                self.interpolation_start_pose = pose_matrix
+                            # Face is lost; the next one found is picked on confidence alone
+                            self._last_face_center = None
+                            # Capture current offsets as start of interpolation
+                            self.interpolation_start_pose = (
+                                self._offsets[:3].copy(),
+                                xyz_euler_to_quat(*self._offsets[3:]),
+                            )
 
                         # Calculate interpolation progress (t from 0 to 1)
                         elapsed_interpolation = current_time - self.interpolation_start_time
                         t = min(1.0, elapsed_interpolation / self.interpolation_duration)
 
-                        # Linear interpolation between current pose and neutral pose
-                        from reachy_mini.utils.interpolation import linear_pose_interpolation
-                        interpolated_pose = linear_pose_interpolation(
-                            self.interpolation_start_pose, neutral_pose, t
-                        )
-
-                        # Extract translation and rotation from interpolated pose
-                        translation = interpolated_pose[:3, 3]
-                        rotation = R.from_matrix(interpolated_pose[:3, :3]).as_euler("xyz", degrees=False)
+                        # Interpolate toward the neutral pose: the translation
+                        # shrinks linearly and the rotation slerps to identity
+                        start_translation, start_quat = self.interpolation_start_pose
+                        translation = (1.0 - t) * start_translation
+                        rotation = quat_to_xyz_euler(quat_slerp(start_quat, NEUTRAL_QUAT, t))
 
                         # Update face tracking offsets (thread-safe)
-                        with self.face_tracking_lock:
-                            self.face_tracking_offsets = (
-                                float(translation[0]),
-                                float(translation[1]),
-                                float(translation[2]),
-                                float(rotation[0]),
-                                float(rotation[1]),
-                                float(rotation[2]),
-                            )
+                        self._offsets[:3] = translation
+                        self._offsets[3:] = rotation
+                        self._publish_offsets()
 
                         # If interpolation is complete, reset timing
                         if t >= 1.0:
@@ -232,8 +323,15 @@ class CameraWorker:
                             self.interpolation_start_time = None
                             self.interpolation_start_pose = None
 
-                # Small sleep to prevent excessive CPU usage (~30 Hz to feed 100 Hz control)
-                time.sleep(0.033)
+                # Sleep until the next deadline rather than a fixed 33 ms after
+                # the work, so detection time doesn't stretch the period
+                now = time.monotonic()
+                if next_deadline > now:
+                    time.sleep(next_deadline - now)
+                    next_deadline += period
+                else:
+                    # Overran the slot: restart the cadence instead of bursting to catch up
+                    next_deadline = now + period
 
             except Exception as e:
                 logger.error(f"Camera worker error: {e}", exc_info=True)
@@ -1,17 +1,65 @@
+import math
+import os
 import threading
 from reachy_mini import ReachyMini, ReachyMiniApp
 from reachy_mini.utils import create_head_pose
-from reachy_mini.utils.interpolation import compose_world_offset
 import numpy as np
 import time
 from pydantic import BaseModel
-from scipy.spatial.transform import Rotation as R
 
 from reachy_mini_ranger.brain.graph import compile_graph
 from reachy_mini_ranger.brain.models.state import create_initial_state
+from reachy_mini_ranger.brain.utils.kinematics import compose_head_pose, warmup as warmup_kinematics
+from reachy_mini_ranger.brain_worker import BrainWorker
 from reachy_mini_ranger.camera_worker import CameraWorker
 
 
+# Manual-mode targets, built once at import
+_NEUTRAL_HEAD = create_head_pose(yaw=0.0, pitch=0.0, roll=0.0, degrees=True)
+_ZERO_ANTENNAS = np.zeros(2)
+
+
+def _pin_control_loop() -> None:
+    """Give the calling (control loop) thread a core and priority of its own.
+    
+    Opt-in with RANGER_PIN_CONTROL_LOOP=1 (Linux only). The calling thread is
+    pinned to the last CPU and every other running Python thread (camera,
+    brain, detection, settings server) to the remaining ones; threads they
+    start later inherit that mask. Real-time SCHED_FIFO is tried first, then
+    nice -10. Both need CAP_SYS_NICE, so a refusal is reported and the loop
+    keeps its normal priority.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        print("Control loop pinning is not supported on this platform", flush=True)
+        return
+    
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) > 1:
+        control_cpu, other_cpus = cpus[-1], set(cpus[:-1])
+        current = threading.current_thread()
+        for thread in threading.enumerate():
+            if thread is not current and thread.native_id is not None:
+                try:
+                    os.sched_setaffinity(thread.native_id, other_cpus)
+                except OSError:
+                    pass  # Thread exited meanwhile
+        # pid 0 is the calling thread on Linux, not the whole process
+        os.sched_setaffinity(0, {control_cpu})
+        print(f"Control loop pinned to CPU {control_cpu}", flush=True)
+    
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        print("Control loop running with SCHED_FIFO priority 20", flush=True)
+        return
+    except OSError as e:  # PermissionError without CAP_SYS_NICE
+        print(f"SCHED_FIFO unavailable ({e}), trying nice -10", flush=True)
+    try:
+        os.nice(-10)
+        print("Control loop niceness set to -10", flush=True)
+    except OSError as e:  # PermissionError without CAP_SYS_NICE
+        print(f"Could not raise control loop priority ({e})", flush=True)
+
+
 class ReachyMiniRanger(ReachyMiniApp):
     # Optional: URL to a custom configuration page for the app
     # eg. "http://localhost:8042"
@@ -22,7 +70,7 @@ class ReachyMiniRanger(ReachyMiniApp):
         
         Architecture (matching conversation app):
         - Camera worker thread: ~30 Hz face detection & tracking offset calculation
-        - Brain loop: 10 Hz high-level behavior (scanning, interaction)
+        - Brain worker thread: 10 Hz high-level behavior (scanning, interaction)
         - Main loop: Apply face tracking offsets as secondary move on top of brain commands
         
         This gives smooth face tracking while maintaining responsive brain behavior.
@@ -31,14 +79,23 @@ class ReachyMiniRanger(ReachyMiniApp):
         print("Enabling motors...", flush=True)
         reachy_mini.enable_motors()
         
+        # Compile the kinematics kernels before the workers and control loop
+        # first call them, so no cycle stalls on JIT compilation
+        warmup_kinematics()
+        
         # Start camera worker thread for face tracking
         camera_worker = CameraWorker(reachy_mini)
         camera_worker.start()
         print("Camera worker started (30 Hz face tracking)", flush=True)
         
-        # Initialize brain (no longer needs reachy_mini since camera worker handles camera)
-        graph = compile_graph(reachy_mini=reachy_mini)
-        state = create_initial_state()
+        # Initialize brain; perception reads the camera worker's shared frame
+        # instead of capturing its own
+        graph = compile_graph(
+            reachy_mini=reachy_mini,
+            frame_source=camera_worker.get_latest_frame,
+        )
+        # Brain runs on its own thread so a slow cycle can't stall the 100 Hz loop
+        brain_worker = BrainWorker(graph, create_initial_state())
         
         # Settings for web UI
         antennas_enabled = True
@@ -71,6 +128,7 @@ class ReachyMiniRanger(ReachyMiniApp):
         def update_brain_state(brain_state_update: BrainState):
             nonlocal brain_enabled
             brain_enabled = brain_state_update.enabled
+            brain_worker.set_enabled(brain_enabled)
             return {"brain_enabled": brain_enabled}
         
         @self.settings_app.post("/face_tracking")
@@ -84,48 +142,95 @@ class ReachyMiniRanger(ReachyMiniApp):
         print("Starting control loop at 100 Hz (brain at 10 Hz)...", flush=True)
         loop_start = time.time()
         loop_count = 0
-        brain_cycle_counter = 0  # Run brain at 10 Hz, apply tracking at 100 Hz
+        log_countdown = 100  # Cycles until the next stats line
+        
+        # Last face tracking offsets seen; the camera worker publishes new ones
+        # at ~30 Hz, not every cycle
+        tracked_offsets = None
+        has_face_tracking = False
+        
+        # Antenna command buffer, written in place instead of allocated per cycle
+        antennas_rad = np.zeros(2)
+        
+        # Head commands change at most at the 10 Hz brain rate, so the base pose
+        # is rebuilt only when (yaw, pitch, roll) changes
+        head_pose_key = None
+        base_head_pose = _NEUTRAL_HEAD
+        
+        # Composed (base + face tracking) pose, recomputed in place only when the
+        # base pose or the offsets change, so most cycles do no NumPy work at all
+        tracked_head_pose = np.eye(4)
+        tracked_pose_stale = True
+        
+        # 100 Hz cadence on absolute monotonic deadlines, so overruns don't
+        # accumulate as drift
+        period_ns = 10_000_000
+        next_deadline = time.monotonic_ns()
+        
+        brain_worker.start()
+        print("Brain worker started (10 Hz)", flush=True)
+        
+        # After the workers start, so they stay off the control loop's core
+        if os.environ.get("RANGER_PIN_CONTROL_LOOP") == "1":
+            _pin_control_loop()
         
         try:
             while not stop_event.is_set():
-                cycle_start = time.time()
+                # Sleep until this cycle's deadline; after an overrun, restart the
+                # schedule from now instead of bursting to catch up
+                next_deadline += period_ns
+                now = time.monotonic_ns()
+                if next_deadline > now:
+                    time.sleep((next_deadline - now) / 1e9)
+                else:
+                    next_deadline = now
+                
+                # Latest brain output (10 Hz on the brain worker), read without blocking
+                state = brain_worker.get_state()
                 
                 if brain_enabled:
-                    # Run brain at 10 Hz (every 10 cycles), but apply tracking at 100 Hz
-                    brain_cycle_counter += 1
-                    if brain_cycle_counter >= 10:
-                        state = graph.invoke(state)
-                        brain_cycle_counter = 0
-                    
                     # Get brain's commanded head pose (scanning, looking around, etc.)
                     head_cmd = state.actuator_commands.head
-                    base_head_pose = create_head_pose(
-                        yaw=head_cmd.yaw,
-                        pitch=head_cmd.pitch,
-                        roll=head_cmd.roll,
-                        degrees=True
-                    )
+                    key = (head_cmd.yaw, head_cmd.pitch, head_cmd.roll)
+                    if key != head_pose_key:
+                        head_pose_key = key
+                        tracked_pose_stale = True
+                        base_head_pose = create_head_pose(
+                            yaw=head_cmd.yaw,
+                            pitch=head_cmd.pitch,
+                            roll=head_cmd.roll,
+                            degrees=True
+                        )
                     
                     # Get face tracking offsets from camera worker (running at 30 Hz)
                     if face_tracking_enabled:
                         offsets = camera_worker.get_face_tracking_offsets()
-                        x, y, z, roll, pitch, yaw = offsets
                         
-                        # Check if we have meaningful face tracking (not all zeros)
-                        has_face_tracking = any(abs(val) > 0.001 for val in offsets)
+                        # Each update publishes a new tuple, so the same object
+                        # means the offsets are unchanged
+                        if offsets is not tracked_offsets:
+                            tracked_offsets = offsets
+                            tracked_pose_stale = True
+                            x, y, z, roll, pitch, yaw = offsets
+                            
+                            # Check if we have meaningful face tracking (not all zeros);
+                            # a plain or-chain, no generator or any() call
+                            has_face_tracking = (
+                                abs(x) > 0.001 or abs(y) > 0.001 or abs(z) > 0.001
+                                or abs(roll) > 0.001 or abs(pitch) > 0.001 or abs(yaw) > 0.001
+                            )
                         
                         if has_face_tracking:
-                            # Build offset matrix (4x4 homogeneous transform)
-                            offset_matrix = np.eye(4, dtype=np.float32)
-                            offset_matrix[:3, 3] = [x, y, z]  # Translation
-                            offset_matrix[:3, :3] = R.from_euler('xyz', [roll, pitch, yaw]).as_matrix()  # Rotation
-                            
                             # Apply face tracking as SECONDARY move (additive offset)
                             # This matches conversation app's architecture
-                            final_head_pose = compose_world_offset(
-                                base_head_pose,
-                                offset_matrix
-                            )
+                            if tracked_pose_stale:
+                                # compose_world_offset() as one compiled kernel writing
+                                # into the preallocated pose, no offset matrix needed
+                                compose_head_pose(
+                                    *tracked_offsets, base_head_pose, tracked_head_pose
+                                )
+                                tracked_pose_stale = False
+                            final_head_pose = tracked_head_pose
                         else:
                             # No face tracking active, use base pose
                             final_head_pose = base_head_pose
@@ -133,70 +238,65 @@ class ReachyMiniRanger(ReachyMiniApp):
                         # Face tracking disabled, use base pose
                         final_head_pose = base_head_pose
                     
-                    # Send final composed head pose to robot (continuous updates at 50 Hz)
-                    reachy_mini.set_target(head=final_head_pose)
-                
-                # Execute antenna commands (if enabled)
-                if antennas_enabled:
-                    antenna_cmd = state.actuator_commands.antennas
-                    antennas_rad = np.array([
-                        np.deg2rad(antenna_cmd.left),
-                        np.deg2rad(antenna_cmd.right)
-                    ])
+                    # Execute antenna commands (if enabled)
+                    if antennas_enabled:
+                        antenna_cmd = state.actuator_commands.antennas
+                        # Scalar math.radians; np.deg2rad on a float is a ufunc dispatch
+                        antennas_rad[0] = math.radians(antenna_cmd.left)
+                        antennas_rad[1] = math.radians(antenna_cmd.right)
+                        final_antennas = antennas_rad
+                    else:
+                        final_antennas = _ZERO_ANTENNAS
+                    
+                    # Send head and antennas in one target update per cycle
+                    reachy_mini.set_target(head=final_head_pose, antennas=final_antennas)
                 else:
-                    antennas_rad = np.array([0.0, 0.0])
-                
-                reachy_mini.set_target(antennas=antennas_rad)
-            else:
-                # Manual mode: Neutral pose
-                head_pose = create_head_pose(yaw=0.0, pitch=0.0, roll=0.0, degrees=True)
-                reachy_mini.set_target(
-                    head=head_pose,
-                    antennas=np.array([0.0, 0.0]),
-                )
-            
-            # Handle sound play requests from web UI
-            if sound_play_requested:
-                print("Playing sound...")
-                reachy_mini.media.play_sound("wake_up.wav")
-                sound_play_requested = False
-            
-            # Log performance every second
-            loop_count += 1
-            if loop_count % 100 == 0:  # Every second at 100 Hz
-                elapsed = time.time() - loop_start
-                avg_fps = loop_count / elapsed
-                
-                # Get camera worker stats
-                offsets = camera_worker.get_face_tracking_offsets()
-                has_face = any(abs(val) > 0.001 for val in offsets)
+                    # Manual mode: Neutral pose
+                    reachy_mini.set_target(
+                        head=_NEUTRAL_HEAD,
+                        antennas=_ZERO_ANTENNAS,
+                    )
                 
-                # Get actual current head pose from robot
-                current_head = reachy_mini.get_current_head_pose()
-                actual_yaw = current_head.yaw if hasattr(current_head, 'yaw') else 0.0
-                actual_pitch = current_head.pitch if hasattr(current_head, 'pitch') else 0.0
+                # Handle sound play requests from web UI
+                if sound_play_requested:
+                    print("Playing sound...")
+                    reachy_mini.media.play_sound("wake_up.wav")
+                    sound_play_requested = False
                 
-                # Log with camera worker info
-                if has_face:
-                    x, y, z, roll, pitch, yaw = offsets
-                    print(f"🎯 TRACKING | Offsets: yaw={np.rad2deg(yaw):.1f}° pitch={np.rad2deg(pitch):.1f}° | "
-                          f"Head: yaw={actual_yaw:.1f}° pitch={actual_pitch:.1f}° | "
-                          f"Camera: {camera_worker.frames_processed} frames, {camera_worker.faces_detected} faces", 
-                          flush=True)
-                else:
-                    head_cmd = state.actuator_commands.head
-                    print(f"🔍 SCANNING | Base: yaw={head_cmd.yaw:.1f}° pitch={head_cmd.pitch:.1f}° | "
-                          f"Head: yaw={actual_yaw:.1f}° pitch={actual_pitch:.1f}° | "
-                          f"Camera: {camera_worker.frames_processed} frames", 
-                          flush=True)
-            
-            # Sleep to maintain 100 Hz loop (10ms period)
-            cycle_elapsed = time.time() - cycle_start
-            sleep_time = max(0.0, 0.01 - cycle_elapsed)
-            time.sleep(sleep_time)
+                # Log performance every second
+                loop_count += 1
+                log_countdown -= 1
+                if log_countdown == 0:  # Every second at 100 Hz
+                    log_countdown = 100
+                    elapsed = time.time() - loop_start
+                    avg_fps = loop_count / elapsed
+                    
+                    # Reuse the control path's face check instead of rescanning offsets
+                    has_face = face_tracking_enabled and has_face_tracking
+                    
+                    # Get actual current head pose from robot
+                    current_head = reachy_mini.get_current_head_pose()
+                    actual_yaw = current_head.yaw if hasattr(current_head, 'yaw') else 0.0
+                    actual_pitch = current_head.pitch if hasattr(current_head, 'pitch') else 0.0
+                    
+                    # Log with camera worker info
+                    if has_face:
+                        x, y, z, roll, pitch, yaw = tracked_offsets
+                        print(f"🎯 TRACKING | Offsets: yaw={math.degrees(yaw):.1f}° pitch={math.degrees(pitch):.1f}° | "
+                              f"Head: yaw={actual_yaw:.1f}° pitch={actual_pitch:.1f}° | "
+                              f"Camera: {camera_worker.frames_processed} frames, {camera_worker.faces_detected} faces", 
+                              flush=True)
+                    else:
+                        head_cmd = state.actuator_commands.head
+                        print(f"🔍 SCANNING | Base: yaw={head_cmd.yaw:.1f}° pitch={head_cmd.pitch:.1f}° | "
+                              f"Head: yaw={actual_yaw:.1f}° pitch={actual_pitch:.1f}° | "
+                              f"Camera: {camera_worker.frames_processed} frames", 
+                              flush=True)
         
         finally:
-            # Clean shutdown of camera worker
+            # Clean shutdown of brain and camera workers
+            print("Stopping brain worker...", flush=True)
+            brain_worker.stop()
             print("Stopping camera worker...", flush=True)
             camera_worker.stop()
 
@@ -17,6 +17,7 @@ from reachy_mini_ranger.brain.models.state import (
     ActuatorCommands,
     BrainState,
     ConversationContext,
+    DetectedObject,
     EmotionState,
     Face,
     Goal,
@@ -35,7 +36,9 @@ from reachy_mini_ranger.brain.models.state import (
     VisionData,
     WorldModel,
     add_log,
+    add_logs,
     create_initial_state,
+    log_tags,
     update_timestamp,
 )
 
@@ -198,6 +201,22 @@ class TestNestedModels:
         assert goal.details["target_person_id"] == "person_123"
 
 
+    def test_typed_details_and_objects(self):
+        """Test details, entities and objects use concrete schemas."""
+        obj = DetectedObject(label="cup", bbox=(10, 20, 30, 40), confidence=0.8)
+        world = WorldModel(objects=[obj])
+        
+        assert world.objects[0].bbox == (10.0, 20.0, 30.0, 40.0)
+        with pytest.raises(ValidationError):
+            Goal(
+                id="g",
+                goal_type=GoalType.IDLE_EXPLORE,
+                priority=1,
+                details={"nested": {"a": 1}},
+            )
+        with pytest.raises(ValidationError):
+            WorldModel(objects=["cup"])
+
 class TestFactoryHelpers:
     """Test factory helper functions."""
 
@@ -236,6 +255,45 @@ class TestFactoryHelpers:
         # Should have logs 50-149 (last 100)
         assert "Log 149" in state.metadata.logs[-1]
 
+    def test_add_logs_appends_in_order(self):
+        """Test add_logs appends every message with one shared timestamp."""
+        state = create_initial_state()
+        updated = add_logs(state, ["Safety: clamped", "Execution: ok"])
+        
+        assert len(state.metadata.logs) == 0
+        assert len(updated.metadata.logs) == 2
+        assert updated.metadata.logs[0].endswith("Safety: clamped")
+        assert updated.metadata.logs[1].endswith("Execution: ok")
+        assert updated.metadata.logs[0].split(": ")[0] == updated.metadata.logs[1].split(": ")[0]
+
+    def test_log_tags(self):
+        """Test log_tags collects the tag of each log entry."""
+        state = create_initial_state()
+        state = add_log(state, "Perception: 1 face(s)")
+        state = add_log(state, "Execution: ok")
+        
+        assert log_tags(state) == {"Perception", "Execution"}
+
+    def test_logs_bounded_when_loaded_from_list(self):
+        """Test logs validated from a plain list stay bounded."""
+        metadata = Metadata(logs=[f"Log {i}" for i in range(150)])
+        
+        assert len(metadata.logs) == 100
+        metadata.logs.append("Log 150")
+        assert len(metadata.logs) == 100
+        assert metadata.logs[0] == "Log 51"
+
+    def test_logs_bounded_after_json_round_trip(self):
+        """Test logs stay a bounded deque when state is reloaded from JSON."""
+        state = create_initial_state()
+        for i in range(5):
+            state = add_log(state, f"Log {i}")
+        
+        restored = BrainState.model_validate_json(state.model_dump_json())
+        
+        assert list(restored.metadata.logs) == list(state.metadata.logs)
+        assert restored.metadata.logs.maxlen == 100
+
 
 class TestSerialization:
     """Test model serialization and deserialization."""
@@ -0,0 +1,82 @@
+"""Unit tests for the background brain worker."""
+
+import time
+
+from reachy_mini_ranger.brain.models.state import create_initial_state
+from reachy_mini_ranger.brain_worker import BrainWorker
+
+
+class _StubGraph:
+    """Graph returning a new state per invoke, failing on request."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def invoke(self, state):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("brain cycle failed")
+        head = state.actuator_commands.head
+        head = head.model_copy(update={"yaw": head.yaw + 1.0})
+        return state.model_copy(update={
+            "actuator_commands": state.actuator_commands.model_copy(update={"head": head}),
+        })
+
+
+def _cycles(state):
+    """Number of stub graph cycles behind a state."""
+    return int(state.actuator_commands.head.yaw)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.001)
+    return predicate()
+
+
+class TestBrainWorker:
+    """Test brain worker publishing and control."""
+
+    def test_publishes_new_states(self):
+        """Test each cycle publishes the graph's returned state."""
+        initial = create_initial_state()
+        worker = BrainWorker(_StubGraph(), initial, rate_hz=200.0)
+        worker.start()
+        try:
+            assert _wait_for(lambda: _cycles(worker.get_state()) >= 3)
+        finally:
+            worker.stop()
+
+        assert worker.get_state() is not initial
+        assert _cycles(initial) == 0
+        assert worker.cycles_run == _cycles(worker.get_state())
+
+    def test_disabled_worker_keeps_last_state(self):
+        """Test disabling pauses brain cycles without dropping the state."""
+        graph = _StubGraph()
+        initial = create_initial_state()
+        worker = BrainWorker(graph, initial, rate_hz=200.0)
+        worker.set_enabled(False)
+        worker.start()
+        try:
+            time.sleep(0.05)
+        finally:
+            worker.stop()
+
+        assert graph.calls == 0
+        assert worker.get_state() is initial
+
+    def test_survives_failing_cycle(self):
+        """Test a failing cycle is logged and the loop keeps running."""
+        graph = _StubGraph()
+        graph.fail = True
+        worker = BrainWorker(graph, create_initial_state(), rate_hz=200.0)
+        worker.start()
+        try:
+            assert _wait_for(lambda: graph.calls >= 2)
+            graph.fail = False
+            assert _wait_for(lambda: _cycles(worker.get_state()) >= 1)
+        finally:
+            worker.stop()
@@ -171,6 +171,16 @@ class TestExecutionNodeSafety:
         # Execution log should exist
         assert any("Execution:" in log for log in result.metadata.logs)
     
+    def test_execution_node_verbose_logging(self):
+        """Test head angles are only logged when verbose or on violation."""
+        state = create_initial_state()
+        result = execution_node(state)
+        assert not any("head=" in log for log in result.metadata.logs)
+        
+        state.metadata.verbose_logging = True
+        result = execution_node(state)
+        assert any("Execution: head=(0.0°, 0.0°, 0.0°)" in log for log in result.metadata.logs)
+    
     def test_execution_node_updates_timestamp(self):
         """Test execution node updates timestamp."""
         state = create_initial_state()
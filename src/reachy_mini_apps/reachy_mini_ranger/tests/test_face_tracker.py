@@ -9,7 +9,9 @@ from reachy_mini_ranger.brain.nodes.perception.face_tracker import (
     FaceTracker,
     TrackedFace,
 )
-from reachy_mini_ranger.brain.nodes.perception.vision_node import process_camera_frame
+from reachy_mini_ranger.brain.nodes.perception.vision_node import (
+    process_camera_frame,
+)
 from reachy_mini_ranger.brain.models.state import Face, Position3D
 
 
@@ -45,7 +47,7 @@ class TestFaceTrackerInitialization:
         assert tracker.max_distance == 100.0
         assert tracker.track_timeout == 2.0
         assert tracker.next_id == 1
-        assert len(tracker.tracks) == 0
+        assert len(tracker.snapshot_tracks()) == 0
 
     def test_initialization_custom_params(self):
         """Test tracker initializes with custom parameters."""
@@ -133,6 +135,61 @@ class TestFaceTracking:
         # But update only returns active, so we check tracker state
         assert tracker.get_track_count() == 2
 
+    def test_many_faces_keep_ids(self, tracker):
+        """Test matching past the initial buffer size keeps every ID."""
+        faces = [create_test_face(i * 150 % 1200, i // 8 * 150, 40, 40) for i in range(12)]
+        first_ids = [t.persistent_id for t in tracker.update(faces)]
+        
+        moved = [create_test_face(f.x + 5, f.y + 5, 40, 40) for f in faces]
+        tracked = tracker.update(moved)
+        
+        assert tracker.get_track_count() == 12
+        assert [t.persistent_id for t in tracked] == first_ids
+        assert [t.face.x for t in tracked] == [f.x for f in moved]
+
+    def test_update_with_box_array(self, tracker):
+        """Test a precomputed box array gives the same tracks as Face records."""
+        faces = [create_test_face(100, 100, 50, 50), create_test_face(400, 200, 60, 80)]
+        boxes = np.array([(f.x, f.y, f.width, f.height) for f in faces], dtype=np.float32)
+        reference = FaceTracker()
+        
+        tracked = tracker.update(faces, boxes=boxes)
+        expected = reference.update(faces)
+        
+        assert [t.persistent_id for t in tracked] == [t.persistent_id for t in expected]
+        for track, ref in zip(tracked, expected):
+            np.testing.assert_array_equal(track.centroid, ref.centroid)
+
+    def test_get_track_by_persistent_id(self, tracker):
+        """Test get_track looks up tracks and returns detached snapshots."""
+        tracked = tracker.update([create_test_face(100, 100, 50, 50), create_test_face(400, 100, 50, 50)])
+        second_id = tracked[1].persistent_id
+        
+        track = tracker.get_track(second_id)
+        assert track.persistent_id == second_id
+        assert track.centroid[0] == 425
+        assert tracker.get_track(999) is None
+        
+        # Moving the face must not change the record returned earlier
+        tracker.update([create_test_face(100, 100, 50, 50), create_test_face(420, 100, 50, 50)])
+        assert track.centroid[0] == 425
+        assert tracker.get_track(second_id).centroid[0] == 445
+
+    def test_assignment_is_globally_optimal(self, tracker):
+        """Test matching keeps both IDs where greedy nearest-pair would not."""
+        # Two tracks 60px apart
+        tracked = tracker.update([create_test_face(0, 0, 50, 50), create_test_face(60, 0, 50, 50)])
+        id_a, id_b = (t.persistent_id for t in tracked)
+        
+        # Both move right by 50px: greedy would pair B with A's new spot
+        # (10px) and leave A 110px from B's new spot (> max_distance)
+        tracked = tracker.update([create_test_face(50, 0, 50, 50), create_test_face(110, 0, 50, 50)])
+        
+        assert tracker.get_track_count() == 2
+        by_id = {t.persistent_id: t for t in tracked}
+        assert by_id[id_a].face.x == 50
+        assert by_id[id_b].face.x == 110
+
 
 # ============================================================================
 # Track Expiration Tests
@@ -174,6 +231,17 @@ class TestTrackExpiration:
         # Track should still be active
         assert tracker.get_track_count() == 1
 
+    def test_expiry_uses_given_monotonic_time(self):
+        """Test update(now=...) ages tracks against the supplied clock."""
+        tracker = FaceTracker(track_timeout=2.0)
+        
+        tracker.update([create_test_face(100, 100, 50, 50)], now=100.0)
+        tracker.update([], now=101.5)
+        assert tracker.get_track_count() == 1
+        
+        tracker.update([], now=102.5)
+        assert tracker.get_track_count() == 0
+
 
 # ============================================================================
 # 3D Position Estimation Tests
@@ -247,6 +315,23 @@ class TestPositionEstimation:
         # x should be close to 0 (within tolerance)
         assert abs(position.x) < 0.1
 
+    def test_batch_matches_scalar(self, tracker):
+        """Test batched positions match estimate_3d_position per track."""
+        faces = [
+            create_test_face(100, 100, 50, 50),
+            create_test_face(400, 300, 120, 120),
+            create_test_face(10, 10, 2, 2),  # Depth clamped to 5.0m
+        ]
+        tracked = tracker.update(faces)
+        
+        positions = tracker.estimate_3d_positions_batch(640, 480)
+        
+        assert positions.shape == (3, 3)
+        assert positions.dtype == np.float32
+        for track, row in zip(tracked, positions):
+            expected = tracker.estimate_3d_position(track, 640, 480)
+            assert row == pytest.approx([expected.x, expected.y, expected.z], rel=1e-5)
+
 
 # ============================================================================
 # Primary Face Selection Tests
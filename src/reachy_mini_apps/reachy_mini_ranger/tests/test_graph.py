@@ -13,12 +13,18 @@ from reachy_mini_ranger.brain.graph import (
     compile_graph,
     create_graph,
     run_brain_cycle,
+    reset_brain_cycle,
     perception_node,
     cognition_node,
     skill_node,
     execution_node,
 )
-from reachy_mini_ranger.brain.models.state import create_initial_state, BrainState
+from reachy_mini_ranger.brain.models.state import (
+    create_initial_state,
+    BrainState,
+    Human,
+    Position3D,
+)
 
 
 class TestGraphCompilation:
@@ -71,6 +77,23 @@ class TestNodeExecution:
         
         assert isinstance(result, BrainState)
 
+    def test_cognition_node_uses_primary_human_id(self):
+        """Test cognition_node switches to neutral pose when a primary human is set."""
+        state = create_initial_state()
+        state.world_model.humans = [
+            Human(human_id=1, persistent_id=1, position=Position3D(x=0.0, y=0.0, z=1.0)),
+            Human(
+                human_id=2, persistent_id=2, position=Position3D(x=0.2, y=0.0, z=1.0),
+                is_primary=True,
+            ),
+        ]
+        assert state.world_model.primary_human_id == 2
+        
+        result = cognition_node(state)
+        
+        assert result.actuator_commands.head.yaw == 0.0
+        assert "Human detected" in result.metadata.logs[-1]
+
     def test_skill_node_returns_dict(self):
         """Test skill_node returns BrainState."""
         state = create_initial_state()
@@ -200,6 +223,15 @@ class TestRunBrainCycle:
         # Should accumulate logs (4 per cycle × 3 cycles = 12)
         assert len(state.metadata.logs) >= 12
 
+    def test_run_brain_cycle_after_reset(self):
+        """Test run_brain_cycle recompiles after reset_brain_cycle."""
+        state = run_brain_cycle(create_initial_state())
+        
+        reset_brain_cycle()
+        result = run_brain_cycle(state)
+        
+        assert len(result.metadata.logs) >= 8
+
 
 class TestGraphEdges:
     """Test graph connectivity."""
@@ -3,12 +3,26 @@
 import pytest
 import math
 
+import numpy as np
+from scipy.spatial.transform import Rotation, Slerp
+
 from reachy_mini_ranger.brain.utils.kinematics import (
     calculate_look_at_angles,
     apply_safety_limits,
     smooth_transition,
     calculate_look_at_with_safety,
+    clamp_head,
     ease_in_out_cubic,
+    quat_slerp,
+    quat_to_xyz_euler,
+    rotmat_to_xyz_euler,
+    xyz_euler_to_quat,
+    xyz_euler_to_rotmat,
+    compose_head_pose,
+    warmup,
+    CLAMP_PITCH_HIGH,
+    CLAMP_ROLL_LOW,
+    CLAMP_YAW_HIGH,
     HEAD_YAW_LIMIT,
     HEAD_PITCH_LIMIT,
     HEAD_ROLL_LIMIT,
@@ -155,6 +169,28 @@ class TestApplySafetyLimits:
         assert pitch == HEAD_PITCH_LIMIT
         assert roll == -HEAD_ROLL_LIMIT
 
+    def test_single_warning_per_clamp(self, caplog):
+        """Test clamping several axes logs one warning, and none when disabled."""
+        with caplog.at_level("WARNING"):
+            apply_safety_limits(200.0, 50.0, -50.0)
+            apply_safety_limits(200.0, 50.0, -50.0, warn_on_clamp=False)
+            apply_safety_limits(10.0, 10.0, 10.0)
+        assert len(caplog.records) == 1
+
+
+class TestClampHead:
+    """Test absolute head clamp with violation mask."""
+
+    def test_within_limits_no_violations(self):
+        """Test in-range angles pass through with empty mask."""
+        assert clamp_head(30.0, 20.0, -10.0) == (30.0, 20.0, -10.0, 0)
+
+    def test_violation_mask(self):
+        """Test out-of-range angles are clamped and flagged."""
+        yaw, pitch, roll, mask = clamp_head(200.0, 50.0, -50.0)
+        assert (yaw, pitch, roll) == (HEAD_YAW_LIMIT, HEAD_PITCH_LIMIT, -HEAD_ROLL_LIMIT)
+        assert mask == CLAMP_YAW_HIGH | CLAMP_PITCH_HIGH | CLAMP_ROLL_LOW
+
 
 # ============================================================================
 # Smooth Transition Tests
@@ -204,6 +240,23 @@ class TestSmoothTransition:
         assert angle_negative == 10.0  # Clamped to 0
         assert angle_excess == 50.0  # Clamped to 1
 
+    def test_wraps_multi_turn_angles(self):
+        """Test angles several turns away wrap in one step to [-180, 180]."""
+        assert smooth_transition(0.0, 3610.0, 1.0, "linear") == pytest.approx(10.0)
+        assert smooth_transition(-7200.0, 0.0, 0.0, "linear") == pytest.approx(0.0)
+        assert smooth_transition(0.0, 180.0, 1.0, "linear") == 180.0
+
+    @pytest.mark.parametrize("angle", [180.0, -180.0, 540.0, -540.0, 900.0, 190.0, -190.0])
+    def test_wrap_boundary_matches_loop_reduction(self, angle):
+        """Test ±180 limits wrap exactly as repeated ±360 steps do (+180 stays +180)."""
+        expected = angle
+        while expected > 180:
+            expected -= 360
+        while expected < -180:
+            expected += 360
+        assert smooth_transition(0.0, angle, 1.0, "linear") == expected
+        assert smooth_transition(angle, 0.0, 0.0, "linear") == expected
+
 
 # ============================================================================
 # Easing Function Tests
@@ -303,6 +356,27 @@ class TestCalculateLookAtWithSafety:
         # Should show smooth progression
         assert 0 < yaw1 < yaw2
 
+    @pytest.mark.parametrize("easing", ["linear", "cubic"])
+    def test_matches_stepwise_pipeline(self, easing):
+        """Test fused kernel agrees with look-at -> limits -> smoothing."""
+        for target, current, body_yaw, progress in [
+            ((1.0, 0.5, 0.2), (170.0, 0.0, 0.0), 0.0, 0.3),
+            ((-1.0, -0.2, 2.0), (-170.0, 10.0, 5.0), 100.0, 0.6),
+            ((0.5, -1.0, -0.5), (0.0, 0.0, 0.0), -20.0, 1.0),
+        ]:
+            expected = apply_safety_limits(
+                *calculate_look_at_angles(*target), body_yaw, warn_on_clamp=False
+            )
+            if progress < 1.0:
+                expected = [
+                    smooth_transition(c, t, progress, easing)
+                    for c, t in zip(current, expected)
+                ]
+            result = calculate_look_at_with_safety(
+                *target, *current, body_yaw=body_yaw, progress=progress, easing=easing
+            )
+            assert result == pytest.approx(tuple(expected), abs=1e-9)
+
 
 # ============================================================================
 # Edge Case Tests
@@ -339,6 +413,81 @@ class TestEdgeCases:
         assert -180 <= yaw <= 180
 
 
+# ============================================================================
+# Rotation Helper Tests
+# ============================================================================
+
+
+class TestRotationHelpers:
+    """Test closed-form rotation helpers against scipy's Rotation."""
+
+    EULERS = [
+        (0.0, 0.0, 0.0),
+        (0.3, -0.2, 0.5),
+        (-0.6, 0.7, -2.5),
+        (1.2, -1.3, 3.0),
+    ]
+
+    def test_quat_to_xyz_euler_matches_scipy(self):
+        """Test quaternion -> xyz euler agrees with Rotation.as_euler."""
+        for euler in self.EULERS:
+            quat = Rotation.from_euler("xyz", euler).as_quat()
+            assert quat_to_xyz_euler(quat) == pytest.approx(euler, abs=1e-9)
+
+    def test_rotmat_to_xyz_euler_matches_scipy(self):
+        """Test matrix -> xyz euler agrees with Rotation.as_euler, on 4x4 poses too."""
+        for euler in self.EULERS:
+            pose = np.eye(4)
+            pose[:3, :3] = Rotation.from_euler("xyz", euler).as_matrix()
+            assert rotmat_to_xyz_euler(pose) == pytest.approx(euler, abs=1e-9)
+            assert rotmat_to_xyz_euler(pose[:3, :3].astype(np.float32)) == pytest.approx(euler, abs=1e-5)
+
+    def test_euler_to_rotmat_and_quat_match_scipy(self):
+        """Test xyz euler -> matrix / quaternion agree with Rotation.from_euler."""
+        for euler in self.EULERS:
+            rotation = Rotation.from_euler("xyz", euler)
+            assert np.allclose(xyz_euler_to_rotmat(*euler), rotation.as_matrix(), atol=1e-12)
+            q = xyz_euler_to_quat(*euler)
+            expected = rotation.as_quat()
+            assert min(np.abs(q - expected).max(), np.abs(q + expected).max()) < 1e-12
+
+    def test_quat_slerp_matches_scipy(self):
+        """Test slerp agrees with scipy's Slerp, including toward identity."""
+        identity = np.array([0.0, 0.0, 0.0, 1.0])
+        for euler in self.EULERS:
+            start = Rotation.from_euler("xyz", euler)
+            slerp = Slerp([0.0, 1.0], Rotation.concatenate([start, Rotation.identity()]))
+            for t in (0.0, 0.25, 0.5, 1.0):
+                q = quat_slerp(start.as_quat(), identity, t)
+                expected = slerp(t).as_quat()
+                # q and -q are the same rotation
+                assert min(np.abs(q - expected).max(), np.abs(q + expected).max()) < 1e-9
+
+    def test_compose_head_pose_matches_world_offset(self):
+        """Test the fused composition against R_off @ R_base with added translations."""
+        base = np.eye(4)
+        base[:3, :3] = Rotation.from_euler("xyz", (0.1, -0.3, 0.8)).as_matrix()
+        base[:3, 3] = (0.01, -0.02, 0.03)
+        offset = (0.002, -0.001, 0.004)
+        for euler in self.EULERS:
+            expected = np.eye(4)
+            expected[:3, :3] = Rotation.from_euler("xyz", euler).as_matrix() @ base[:3, :3]
+            expected[:3, 3] = base[:3, 3] + offset
+            out = np.full((4, 4), np.nan)
+            compose_head_pose(*offset, *euler, base, out)
+            assert np.allclose(out, expected, atol=1e-12)
+            # In place on the base pose gives the same result
+            in_place = base.copy()
+            compose_head_pose(*offset, *euler, in_place, in_place)
+            assert np.allclose(in_place, expected, atol=1e-12)
+
+    def test_warmup_compiles_without_side_effects(self):
+        """Test warmup() runs every kernel and leaves results unchanged."""
+        warmup()
+        assert clamp_head(200.0, 0.0, 0.0)[:3] == (HEAD_YAW_LIMIT, 0.0, 0.0)
+        assert np.allclose(xyz_euler_to_rotmat(0.0, 0.0, 0.0), np.eye(3))
+
+
 # ============================================================================
 # Test Markers
 # ============================================================================
@@ -1,11 +1,19 @@
 """Unit tests for vision perception node and face detection."""
 
+import threading
+import time
+
 import pytest
 import numpy as np
 from datetime import datetime
+from pathlib import Path
 
+from reachy_mini_ranger.brain.nodes.perception import vision_node as vision_module
 from reachy_mini_ranger.brain.nodes.perception.vision_node import (
+    DetectionWorker,
+    export_onnx,
     FaceDetectionNode,
+    PinnedInputBuffer,
     vision_node,
 )
 from reachy_mini_ranger.brain.models.state import create_initial_state, Face
@@ -40,6 +48,11 @@ class TestFaceDetectionNodeInitialization:
         # Model should have predict/inference methods
         assert hasattr(node.model, "__call__")
 
+    def test_unknown_backend_raises(self):
+        """Test unsupported inference backend is rejected before model loading."""
+        with pytest.raises(ValueError, match="Unknown detector backend"):
+            FaceDetectionNode(backend="tflite")
+
 
 class TestFaceDetection:
     """Test face detection functionality."""
@@ -98,6 +111,22 @@ class TestFaceDetection:
         for face in faces:
             assert face.confidence >= 0.9
 
+    def test_motion_gate_skips_static_frames(self, detector):
+        """Test near-identical frames reuse the last detections."""
+        calls = []
+        model = detector.model
+        detector.model = lambda *args, **kwargs: calls.append(1) or model(*args, **kwargs)
+        detector.motion_threshold = 5.0
+        frame = np.full((480, 640, 3), 100, dtype=np.uint8)
+
+        first = detector.detect_boxes(frame)
+        second = detector.detect_boxes(frame.copy())
+        assert len(calls) == 1
+        assert second is first
+
+        detector.detect_boxes(np.full((480, 640, 3), 200, dtype=np.uint8))
+        assert len(calls) == 2
+
     def test_face_id_increments(self, detector):
         """Test face IDs increment correctly across detections."""
         test_frame = np.ones((480, 640, 3), dtype=np.uint8) * 128
@@ -127,6 +156,225 @@ class TestFaceDetection:
             assert face.y + face.height <= h
 
 
+class _NoBoxesResult:
+    """Ultralytics-style result without detections."""
+    boxes = None
+
+
+class _CheckingModel:
+    """Stub model that records overlapping calls and inputs changing mid-call."""
+
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.overlaps = 0
+        self.mismatches = 0
+
+    def __call__(self, source, **kwargs):
+        self.calls += 1
+        self.active += 1
+        if self.active > 1:
+            self.overlaps += 1
+        before = float(source.max())
+        time.sleep(0.005)
+        if float(source.max()) != before:
+            self.mismatches += 1
+        self.active -= 1
+        return [_NoBoxesResult()]
+
+
+def _bare_detector(model, input_buffer=None, motion_threshold=0.0):
+    """FaceDetectionNode around a stub model, skipping the model download."""
+    detector = FaceDetectionNode.__new__(FaceDetectionNode)
+    detector.confidence_threshold = 0.5
+    detector.device = "cpu"
+    detector.backend = "torch"
+    detector.motion_threshold = motion_threshold
+    detector.next_face_id = 1
+    detector._id_lock = threading.Lock()
+    detector._motion_gate = None
+    detector._predict_kwargs = {}
+    detector._input_buffer = input_buffer
+    detector._inference_lock = threading.Lock()
+    detector.model = model
+    return detector
+
+
+def _run_concurrently(target, args_per_thread):
+    """Run target once per argument tuple on its own thread and wait for all."""
+    threads = [threading.Thread(target=target, args=args) for args in args_per_thread]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestSharedDetector:
+    """Test the singleton detector is safe to call from several threads."""
+
+    @pytest.mark.parametrize("pinned", [False, True])
+    def test_model_calls_serialised(self, pinned):
+        """Test concurrent detect_boxes calls never overlap inside the model."""
+        model = _CheckingModel()
+        buffer = PinnedInputBuffer("cpu", imgsz=64) if pinned else None
+        detector = _bare_detector(model, input_buffer=buffer)
+
+        def detect(value):
+            for _ in range(10):
+                detector.detect_boxes(np.full((48, 64, 3), value, dtype=np.uint8))
+
+        _run_concurrently(detect, [(0,), (255,)])
+
+        assert model.calls == 20
+        assert model.overlaps == 0
+        assert model.mismatches == 0
+
+    def test_motion_gate_shared_across_threads(self):
+        """Test concurrent callers with a static scene run inference only once."""
+        model = _CheckingModel()
+        detector = _bare_detector(model, motion_threshold=5.0)
+        frame = np.full((48, 64, 3), 80, dtype=np.uint8)
+
+        def detect():
+            for _ in range(2):
+                detector.detect_boxes(frame)
+
+        _run_concurrently(detect, [()] * 2)
+
+        assert model.calls == 1
+        assert model.overlaps == 0
+
+    def test_face_ids_unique_across_threads(self):
+        """Test concurrent faces_from_boxes calls never reuse a face ID."""
+        detector = _bare_detector(_CheckingModel())
+        boxes = np.tile(np.array([[0, 0, 10, 10]], dtype=np.float32), (3, 1))
+        confidences = np.full(3, 0.9, dtype=np.float32)
+        face_ids = []
+
+        def build():
+            for _ in range(200):
+                face_ids.extend(f.face_id for f in detector.faces_from_boxes(boxes, confidences))
+
+        _run_concurrently(build, [()] * 4)
+
+        assert len(face_ids) == 2400
+        assert len(set(face_ids)) == 2400
+        assert detector.next_face_id == 2401
+
+
+class TestExportOnnx:
+    """Test the ONNX export cache."""
+
+    def test_cache_is_per_precision(self, tmp_path, monkeypatch):
+        """Test FP32 and FP16 exports are cached under separate names."""
+        exports = []
+
+        class _StubYOLO:
+            def __init__(self, path):
+                self.path = Path(path)
+
+            def export(self, format, dynamic, half):
+                exports.append(half)
+                out = self.path.with_suffix(".onnx")
+                out.write_text("fp16" if half else "fp32")
+                return str(out)
+
+        monkeypatch.setattr(vision_module, "YOLO", _StubYOLO)
+        checkpoint = tmp_path / "model.pt"
+        checkpoint.write_text("weights")
+
+        fp32 = export_onnx(str(checkpoint), half=False)
+        fp16 = export_onnx(str(checkpoint), half=True)
+
+        assert Path(fp32).read_text() == "fp32"
+        assert Path(fp16).read_text() == "fp16"
+        assert export_onnx(str(checkpoint), half=True) == fp16
+        assert exports == [False, True]
+
+
+class TestPinnedInputBuffer:
+    """Test reusable letterboxed input buffer."""
+
+    def test_letterbox_geometry(self):
+        """Test frame is scaled and padded into the square model input."""
+        buffer = PinnedInputBuffer("cpu")
+        frame = np.full((720, 1280, 3), 255, dtype=np.uint8)
+
+        scale, pad_x, pad_y = buffer.load(frame)
+
+        assert (scale, pad_x, pad_y) == (0.5, 0, 140)
+        assert buffer.input.shape == (1, 3, 640, 640)
+        assert float(buffer.input[0, :, 320, 320].min()) == 1.0
+        assert float(buffer.input[0, :, 0, 0].max()) == pytest.approx(114 / 255)
+
+    def test_input_tensor_reused(self):
+        """Test loading frames writes into the same input tensor."""
+        buffer = PinnedInputBuffer("cpu")
+        input_tensor = buffer.input
+
+        buffer.load(np.zeros((480, 640, 3), dtype=np.uint8))
+        buffer.load(np.zeros((720, 1280, 3), dtype=np.uint8))
+
+        assert buffer.input is input_tensor
+
+
+class TestDetectionWorker:
+    """Test background detection worker."""
+
+    class _StubDetector:
+        """Detector returning one face per frame, tagged with the frame's fill value."""
+
+        def detect_boxes(self, frame):
+            boxes = np.array([[frame[0, 0, 0], 0, 10, 10]], dtype=np.float32)
+            return boxes, np.array([0.9], dtype=np.float32)
+
+        def faces_from_boxes(self, boxes, confidences):
+            return [Face(
+                face_id=int(boxes[0, 0]), x=0, y=0, width=10, height=10,
+                confidence=float(confidences[0]), timestamp=datetime.now(),
+            )]
+
+    def test_result_tagged_and_popped_once(self):
+        """Test a submitted frame yields one tagged result."""
+        worker = DetectionWorker(self._StubDetector())
+        worker.start()
+        try:
+            frame_id = worker.submit(np.full((48, 64, 3), 7, dtype=np.uint8))
+            deadline = time.time() + 2.0
+            result = None
+            while result is None and time.time() < deadline:
+                result = worker.pop_result()
+                time.sleep(0.001)
+        finally:
+            worker.stop()
+
+        assert result is not None
+        assert result.frame_id == frame_id
+        assert result.faces[0].face_id == 7
+        assert result.boxes.shape == (1, 4)
+        assert result.confidences.shape == (1,)
+        assert (result.frame_width, result.frame_height) == (64, 48)
+        assert worker.pop_result() is None
+
+    def test_latest_frame_replaces_pending(self):
+        """Test frames submitted before the worker runs are replaced by the newest."""
+        worker = DetectionWorker(self._StubDetector())
+        worker.submit(np.full((8, 8, 3), 1, dtype=np.uint8))
+        last_id = worker.submit(np.full((8, 8, 3), 2, dtype=np.uint8))
+        worker.start()
+        try:
+            deadline = time.time() + 2.0
+            result = None
+            while result is None and time.time() < deadline:
+                result = worker.pop_result()
+                time.sleep(0.001)
+        finally:
+            worker.stop()
+
+        assert result.frame_id == last_id
+        assert result.faces[0].face_id == 2
+
+
 class TestFaceDetectionPerformance:
     """Test face detection performance and FPS."""
 